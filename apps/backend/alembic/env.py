@@ -23,8 +23,10 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.db.base import Base
+from app.db.models import load_all_models
 from app.core.config import settings
 
+load_all_models()
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
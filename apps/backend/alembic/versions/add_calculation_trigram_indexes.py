@@ -0,0 +1,48 @@
+"""Add trigram indexes for calculation search
+
+Revision ID: add_calculation_trigram_indexes
+Revises: add_report_trigram_indexes
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_calculation_trigram_indexes'
+down_revision = 'add_report_trigram_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Free-text columns matched by CRUDCalculation.search with ILIKE '%term%'
+TRIGRAM_COLUMNS = ['name', 'description']
+
+
+def upgrade():
+    """Add pg_trgm GIN indexes backing substring calculation search."""
+    
+    # Trigram indexes are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'idx_calculations_{column}_trgm',
+            'calculations',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade():
+    """Remove calculation trigram indexes."""
+    
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for column in TRIGRAM_COLUMNS:
+        op.drop_index(f'idx_calculations_{column}_trgm', table_name='calculations')
@@ -0,0 +1,52 @@
+"""Add inspection status and finding severity indexes
+
+Revision ID: add_inspection_lookup_indexes
+Revises: add_vessel_critical_flag
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_inspection_lookup_indexes'
+down_revision = 'add_vessel_critical_flag'
+branch_labels = None
+depends_on = None
+
+
+# Matches InspectionFinding.is_resolved
+OPEN_FINDING = sa.text("status NOT IN ('completed', 'closed')")
+
+
+def upgrade():
+    """Add inspection status and finding lookup indexes."""
+    
+    op.create_index(
+        'idx_inspections_vessel_status',
+        'inspections',
+        ['vessel_id', 'status']
+    )
+    
+    # Findings are loaded and checked for critical severity per inspection
+    op.create_index(
+        'idx_inspection_findings_inspection_severity',
+        'inspection_findings',
+        ['inspection_id', 'severity']
+    )
+    op.create_index(
+        'idx_inspection_findings_open_target',
+        'inspection_findings',
+        ['target_completion_date'],
+        postgresql_where=OPEN_FINDING,
+        sqlite_where=OPEN_FINDING
+    )
+
+
+def downgrade():
+    """Remove inspection status and finding lookup indexes."""
+    
+    op.drop_index('idx_inspection_findings_open_target', table_name='inspection_findings')
+    op.drop_index('idx_inspection_findings_inspection_severity', table_name='inspection_findings')
+    op.drop_index('idx_inspections_vessel_status', table_name='inspections')
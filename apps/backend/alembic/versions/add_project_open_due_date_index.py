@@ -0,0 +1,35 @@
+"""Add partial index for open project due-date filters
+
+Revision ID: add_project_open_due_date_index
+Revises: add_project_org_status_target_index
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_open_due_date_index'
+down_revision = 'add_project_org_status_target_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add partial due-date index covering only open projects."""
+    
+    # Matches the overdue/due-soon WHERE clauses; the status enum is stored
+    # by member name, so the predicate uses the upper-case labels
+    op.create_index(
+        'idx_projects_org_due_open',
+        'projects',
+        ['organization_id', 'target_completion_date'],
+        postgresql_where=sa.text("status NOT IN ('COMPLETED', 'CANCELLED')")
+    )
+
+
+def downgrade():
+    """Remove partial due-date index."""
+    
+    op.drop_index('idx_projects_org_due_open', table_name='projects')
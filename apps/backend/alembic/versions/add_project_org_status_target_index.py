@@ -0,0 +1,34 @@
+"""Add covering index for project organization/status/due-date filters
+
+Revision ID: add_project_org_status_target_index
+Revises: add_project_trigram_indexes
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_org_status_target_index'
+down_revision = 'add_project_trigram_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add composite index covering organization, status and due date."""
+    
+    # Serves active/status lists, overdue and due-soon filters and their
+    # counts; INCLUDE lets PostgreSQL answer them with index-only scans
+    op.create_index(
+        'idx_projects_org_status_target',
+        'projects',
+        ['organization_id', 'status', 'target_completion_date'],
+        postgresql_include=['id', 'name']
+    )
+
+
+def downgrade():
+    """Remove composite project index."""
+    
+    op.drop_index('idx_projects_org_status_target', table_name='projects')
@@ -0,0 +1,63 @@
+"""Add project_stats_by_org materialized view
+
+Revision ID: add_project_stats_view
+Revises: add_calculation_trigram_indexes
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_stats_view'
+down_revision = 'add_calculation_trigram_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Mirrors CRUDProject._compute_statistics; status is stored by enum name
+PROJECT_STATS_VIEW_SQL = """
+CREATE MATERIALIZED VIEW project_stats_by_org AS
+SELECT
+    organization_id,
+    count(*) AS total_projects,
+    count(*) FILTER (WHERE status = 'ACTIVE') AS active_projects,
+    count(*) FILTER (WHERE status = 'COMPLETED') AS completed_projects,
+    count(*) FILTER (WHERE status = 'CANCELLED') AS cancelled_projects,
+    count(*) FILTER (
+        WHERE target_completion_date < now()
+        AND status NOT IN ('COMPLETED', 'CANCELLED')
+    ) AS overdue_projects,
+    count(*) FILTER (
+        WHERE target_completion_date >= now()
+        AND target_completion_date <= now() + interval '7 days'
+        AND status NOT IN ('COMPLETED', 'CANCELLED')
+    ) AS due_soon_projects
+FROM projects
+GROUP BY organization_id
+"""
+
+
+def upgrade():
+    """Create the per-organization project statistics view."""
+    
+    # Materialized views are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute(PROJECT_STATS_VIEW_SQL)
+    
+    # Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        'CREATE UNIQUE INDEX idx_project_stats_by_org_org '
+        'ON project_stats_by_org (organization_id)'
+    )
+
+
+def downgrade():
+    """Drop the project statistics view."""
+    
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS project_stats_by_org')
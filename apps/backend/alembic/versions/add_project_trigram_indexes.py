@@ -0,0 +1,48 @@
+"""Add trigram indexes for project search
+
+Revision ID: add_project_trigram_indexes
+Revises: add_audit_logs_table
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_project_trigram_indexes'
+down_revision = 'add_audit_logs_table'
+branch_labels = None
+depends_on = None
+
+
+# Columns matched by CRUDProject.search with ILIKE '%term%'
+TRIGRAM_COLUMNS = ['name', 'description', 'project_number']
+
+
+def upgrade():
+    """Add pg_trgm GIN indexes backing substring project search."""
+    
+    # Trigram indexes are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'idx_projects_{column}_trgm',
+            'projects',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade():
+    """Remove project trigram indexes."""
+    
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for column in TRIGRAM_COLUMNS:
+        op.drop_index(f'idx_projects_{column}_trgm', table_name='projects')
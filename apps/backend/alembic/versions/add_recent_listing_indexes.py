@@ -0,0 +1,50 @@
+"""Add indexes for recent project and report listings
+
+Revision ID: add_recent_listing_indexes
+Revises: add_project_stats_view
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_recent_listing_indexes'
+down_revision = 'add_project_stats_view'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add created_at indexes backing the recent-items queries."""
+    
+    # get_recent_projects: organization equality plus ORDER BY created_at
+    # DESC LIMIT n, answered by an index scan without a sort
+    op.create_index(
+        'idx_projects_org_created',
+        'projects',
+        ['organization_id', sa.text('created_at DESC')]
+    )
+    
+    # BRIN indexes are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # Reports are append-mostly, so created_at follows physical order and a
+    # tiny BRIN index prunes the cutoff range for get_recent_reports
+    op.create_index(
+        'idx_reports_created_brin',
+        'reports',
+        ['created_at'],
+        postgresql_using='brin'
+    )
+
+
+def downgrade():
+    """Remove recent listing indexes."""
+    
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('idx_reports_created_brin', table_name='reports')
+    
+    op.drop_index('idx_projects_org_created', table_name='projects')
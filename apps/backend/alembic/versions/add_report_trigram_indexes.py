@@ -0,0 +1,48 @@
+"""Add trigram indexes for report search
+
+Revision ID: add_report_trigram_indexes
+Revises: add_project_open_due_date_index
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_report_trigram_indexes'
+down_revision = 'add_project_open_due_date_index'
+branch_labels = None
+depends_on = None
+
+
+# Free-text columns matched by CRUDReport.search with ILIKE '%term%'
+TRIGRAM_COLUMNS = ['title', 'description']
+
+
+def upgrade():
+    """Add pg_trgm GIN indexes backing substring report search."""
+    
+    # Trigram indexes are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'idx_reports_{column}_trgm',
+            'reports',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade():
+    """Remove report trigram indexes."""
+    
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for column in TRIGRAM_COLUMNS:
+        op.drop_index(f'idx_reports_{column}_trgm', table_name='reports')
@@ -0,0 +1,53 @@
+"""Add trigram indexes for user and vessel service search
+
+Revision ID: add_user_trigram_indexes
+Revises: add_vessel_lookup_indexes
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_user_trigram_indexes'
+down_revision = 'add_vessel_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Columns matched with ILIKE '%term%' by CRUDUser.search and CRUDVessel.search
+TRIGRAM_COLUMNS = {
+    'users': ['first_name', 'last_name', 'email'],
+    'vessels': ['service_fluid'],
+}
+
+
+def upgrade():
+    """Add pg_trgm GIN indexes backing substring user and vessel search."""
+    
+    # Trigram indexes are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                f'idx_{table}_{column}_trgm',
+                table,
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'}
+            )
+
+
+def downgrade():
+    """Remove user and vessel service trigram indexes."""
+    
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f'idx_{table}_{column}_trgm', table_name=table)
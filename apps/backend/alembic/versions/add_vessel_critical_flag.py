@@ -0,0 +1,60 @@
+"""Add stored is_critical flag to vessels
+
+Revision ID: add_vessel_critical_flag
+Revises: add_user_trigram_indexes
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_vessel_critical_flag'
+down_revision = 'add_user_trigram_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Mirrors CRITICAL_CONDITION_SQL in app/db/models/vessel.py
+CRITICAL_CONDITION_SQL = (
+    "COALESCE("
+    "(operating_pressure > 1000 AND operating_temperature > 400)"
+    " OR lower(service_fluid) LIKE '%critical%'"
+    " OR lower(service_fluid) LIKE '%toxic%'"
+    " OR lower(service_fluid) LIKE '%flammable%'"
+    ", false)"
+)
+
+
+def upgrade():
+    """Add the generated is_critical column and its partial index."""
+    
+    # SQLite's ALTER TABLE can only add virtual generated columns, so the
+    # table is rebuilt there to get the same stored column as the model
+    recreate = 'always' if op.get_bind().dialect.name == 'sqlite' else 'auto'
+    
+    with op.batch_alter_table('vessels', recreate=recreate) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                'is_critical',
+                sa.Boolean(),
+                sa.Computed(CRITICAL_CONDITION_SQL, persisted=True),
+                nullable=False
+            )
+        )
+    op.create_index(
+        'idx_vessels_critical',
+        'vessels',
+        ['project_id'],
+        postgresql_where=sa.text('is_critical'),
+        sqlite_where=sa.text('is_critical')
+    )
+
+
+def downgrade():
+    """Remove the is_critical column and its partial index."""
+    
+    op.drop_index('idx_vessels_critical', table_name='vessels')
+    with op.batch_alter_table('vessels') as batch_op:
+        batch_op.drop_column('is_critical')
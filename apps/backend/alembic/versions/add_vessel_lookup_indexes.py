@@ -0,0 +1,68 @@
+"""Add vessel lookup and search indexes
+
+Revision ID: add_vessel_lookup_indexes
+Revises: add_recent_listing_indexes
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_vessel_lookup_indexes'
+down_revision = 'add_recent_listing_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Columns matched by CRUDVessel.search with ILIKE '%term%'
+TRIGRAM_COLUMNS = ['tag_number', 'name', 'description']
+
+
+def upgrade():
+    """Add composite vessel lookup indexes and trigram search indexes."""
+    
+    # Organization-scoped vessel queries join through projects, so the
+    # composites lead with project_id
+    op.create_index(
+        'idx_vessels_project_tag',
+        'vessels',
+        ['project_id', 'tag_number']
+    )
+    op.create_index(
+        'idx_vessels_project_next_inspection',
+        'vessels',
+        ['project_id', 'next_inspection_date']
+    )
+    op.create_index(
+        'idx_vessels_project_type',
+        'vessels',
+        ['project_id', 'vessel_type']
+    )
+    
+    # Trigram indexes are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'idx_vessels_{column}_trgm',
+            'vessels',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade():
+    """Remove vessel lookup and search indexes."""
+    
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in TRIGRAM_COLUMNS:
+            op.drop_index(f'idx_vessels_{column}_trgm', table_name='vessels')
+    
+    op.drop_index('idx_vessels_project_type', table_name='vessels')
+    op.drop_index('idx_vessels_project_next_inspection', table_name='vessels')
+    op.drop_index('idx_vessels_project_tag', table_name='vessels')
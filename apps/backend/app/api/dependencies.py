@@ -5,10 +5,10 @@ Provides dependency injection for FastAPI endpoints including
 user authentication, database sessions, and permission checks.
 """
 
-from typing import Generator, Optional, Union, List
+from typing import Any, Dict, Generator, Optional, Union, List
 
 from jose import jwt
-from fastapi import Depends, HTTPException, status, Query
+from fastapi import Depends, HTTPException, Request, status, Query
 from fastapi.security import OAuth2PasswordBearer
 from jose.exceptions import JWTError as InvalidTokenError
 from sqlalchemy.orm import Session
@@ -64,7 +64,7 @@ def get_current_user(
     except InvalidTokenError:
         raise credentials_exception
     
-    user = user_crud.get(db, id=int(user_id))
+    user = user_crud.get_for_auth(db, user_id=int(user_id))
     if user is None:
         raise credentials_exception
     
@@ -321,7 +321,7 @@ def get_optional_user(
         if user_id is None:
             return None
             
-        user = user_crud.get(db, id=int(user_id))
+        user = user_crud.get_for_auth(db, user_id=int(user_id))
         if user and user.is_active:
             return user
             
@@ -382,3 +382,21 @@ def get_pagination_params(
         Dictionary with skip and limit values
     """
     return {"skip": skip, "limit": limit}
+
+
+def get_request_cache(request: Request) -> Dict[Any, Any]:
+    """
+    Get a cache dict scoped to the current request.
+    
+    CRUD read helpers that accept a ``cache`` argument use it to avoid
+    repeating the same query within one request.
+    
+    Args:
+        request: Current request
+        
+    Returns:
+        Request-scoped cache dictionary
+    """
+    if not hasattr(request.state, "cache"):
+        request.state.cache = {}
+    return request.state.cache
@@ -37,8 +37,10 @@ from app.core.security import (
     verify_token,
     validate_password_strength,
     generate_password_reset_token,
-    verify_password_reset_token
+    verify_password_reset_token,
+    run_in_bcrypt_pool
 )
+from app.crud import organization as org_crud
 from app.crud.user import user_crud
 from app.db.models.user import User
 from app.schemas.auth import (
@@ -95,7 +97,7 @@ async def login(
         )
     
     # Attempt authentication
-    user = user_crud.authenticate(
+    user = await user_crud.authenticate_async(
         db, email=form_data.username, password=form_data.password
     )
     
@@ -204,8 +206,8 @@ async def login(
     audit_context.user_id = user.id
     audit_context.organization_id = user.organization_id
     
-    # Update user last login
-    user_crud.update_last_login(db, user=user)
+    # Update user last login; committed together with the audit entry below
+    user_crud.update_last_login(db, user=user, commit=False)
     
     # Log successful login
     audit_service.log_authentication_event(
@@ -310,8 +312,8 @@ async def register(
         from app.db.models.organization import SubscriptionType
         
         try:
-            default_org = db.query(Organization).first()
-            if not default_org:
+            default_org_id = org_crud.get_default_id(db)
+            if default_org_id is None:
                 logger.info("Creating default organization...")
                 default_org = Organization(
                     name="Default Organization",
@@ -321,8 +323,8 @@ async def register(
                 )
                 db.add(default_org)
                 db.commit()
-                db.refresh(default_org)
-                logger.info(f"Default organization created with ID: {default_org.id}")
+                default_org_id = default_org.id
+                logger.info(f"Default organization created with ID: {default_org_id}")
         except Exception as e:
             logger.error(f"Failed to create default organization: {str(e)}", exc_info=True)
             db.rollback()
@@ -332,15 +334,15 @@ async def register(
             )
         
         # Handle organization creation if user provided organization_name
-        organization_id = default_org.id
+        organization_id = default_org_id
         if user_data.organization_name:
             logger.debug(f"Creating/finding organization: {user_data.organization_name}")
             try:
-                # Check if organization exists
-                org = db.query(Organization).filter(
+                # Check if organization exists; only its id is needed
+                organization_id = db.query(Organization.id).filter(
                     Organization.name == user_data.organization_name
-                ).first()
-                if not org:
+                ).limit(1).scalar()
+                if organization_id is None:
                     logger.info(f"Creating new organization: {user_data.organization_name}")
                     org = Organization(
                         name=user_data.organization_name,
@@ -349,12 +351,13 @@ async def register(
                         is_active=True
                     )
                     db.add(org)
+                    # The id comes back from INSERT ... RETURNING and stays
+                    # loaded after commit, so no refresh is needed
                     db.commit()
-                    db.refresh(org)
-                    logger.info(f"Organization created with ID: {org.id}")
+                    organization_id = org.id
+                    logger.info(f"Organization created with ID: {organization_id}")
                 else:
-                    logger.debug(f"Using existing organization with ID: {org.id}")
-                organization_id = org.id
+                    logger.debug(f"Using existing organization with ID: {organization_id}")
             except Exception as e:
                 logger.error(f"Failed to create organization '{user_data.organization_name}': {str(e)}", exc_info=True)
                 db.rollback()
@@ -385,7 +388,8 @@ async def register(
         # Create user
         logger.debug("Creating user in database...")
         try:
-            user = user_crud.create(db, obj_in=user_create_data)
+            hashed_password = await run_in_bcrypt_pool(get_password_hash, user_create_data.password)
+            user = user_crud.create(db, obj_in=user_create_data, hashed_password=hashed_password)
             logger.info(f"User created successfully with ID: {user.id}")
         except Exception as e:
             logger.error(f"Failed to create user '{user_data.email}': {str(e)}", exc_info=True)
@@ -538,10 +542,10 @@ async def confirm_password_reset(
         )
     
     # Update password
-    hashed_password = get_password_hash(reset_data.new_password)
-    user_crud.update_password(db, user=user, hashed_password=hashed_password)
+    hashed_password = await run_in_bcrypt_pool(get_password_hash, reset_data.new_password)
+    user_crud.update_password(db, user=user, hashed_password=hashed_password, commit=False)
     
-    # Clear reset token
+    # Clear reset token, committing both changes together
     user_crud.clear_password_reset_token(db, user=user)
     
     return {"message": "Password successfully reset"}
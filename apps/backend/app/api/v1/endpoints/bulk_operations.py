@@ -337,12 +337,12 @@ async def bulk_delete_projects(
                 # Check dependencies if not forcing
                 if not bulk_request.force:
                     # Check if project has vessels
-                    vessels = vessel_crud.get_by_project(db=db, project_id=project_id)
-                    if vessels:
+                    vessel_count = vessel_crud.get_vessel_count_by_project(db=db, project_id=project_id)
+                    if vessel_count:
                         error_count += 1
                         errors.append({
                             "project_id": project_id,
-                            "error": f"Project has {len(vessels)} vessels. Use force=true to delete anyway.",
+                            "error": f"Project has {vessel_count} vessels. Use force=true to delete anyway.",
                             "error_type": "DependencyError"
                         })
                         continue
@@ -5,7 +5,7 @@ Handles project management including timeline tracking,
 collaboration, and organization-based access control.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
@@ -14,7 +14,8 @@ from app.api.dependencies import (
     get_current_user,
     get_db,
     require_role,
-    get_pagination_params
+    get_pagination_params,
+    get_request_cache
 )
 from app.crud import project as project_crud
 from app.db.models.user import User
@@ -27,7 +28,8 @@ from app.schemas import (
     ProjectSummary,
     ProjectStatusUpdate,
     ProjectStatistics,
-    ProjectDashboard
+    ProjectDashboard,
+    ProjectTimeline
 )
 
 router = APIRouter()
@@ -56,12 +58,14 @@ def get_projects(
     
     # Apply filters
     if search:
-        projects = project_crud.search(
-            db, query=search, organization_id=current_user.organization_id, skip=skip, limit=limit
+        projects, total = project_crud.search(
+            db,
+            query=search,
+            organization_id=current_user.organization_id,
+            skip=skip,
+            limit=limit,
+            with_total=True
         )
-        total = len(project_crud.search(
-            db, query=search, organization_id=current_user.organization_id, skip=0, limit=10000
-        ))
     elif status:
         projects = project_crud.get_by_status(
             db, status=status, organization_id=current_user.organization_id, skip=skip, limit=limit
@@ -97,7 +101,8 @@ def get_projects(
 def create_project(
     project_in: ProjectCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role(["engineer", "organization_admin", "super_admin"]))
+    current_user: User = Depends(require_role(["engineer", "organization_admin", "super_admin"])),
+    request_cache: Dict[Any, Any] = Depends(get_request_cache)
 ):
     """
     Create new project.
@@ -111,7 +116,9 @@ def create_project(
         )
     
     # Check if organization can create more projects
-    if not project_crud.can_create_project(db, organization_id=current_user.organization_id):
+    if not project_crud.can_create_project(
+        db, organization_id=current_user.organization_id, cache=request_cache
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Organization has reached its project limit"
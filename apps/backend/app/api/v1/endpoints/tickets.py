@@ -30,8 +30,7 @@ def get_tickets(
         filters.append(ticket_crud.model.category == category)
     if search:
         filters.append(ticket_crud.model.subject.ilike(f"%{search}%"))
-    items = ticket_crud.get_multi_filtered(db, filters, skip=skip, limit=limit)
-    total = ticket_crud.count_filtered(db, filters)
+    items, total = ticket_crud.paginate(db, filters, skip=skip, limit=limit)
     return TicketList(
         items=items,
         total=total,
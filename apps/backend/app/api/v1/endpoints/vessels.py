@@ -17,6 +17,7 @@ from app.api.dependencies import (
     get_pagination_params
 )
 from app.crud import vessel as vessel_crud
+from app.crud.vessel import VESSEL_SCHEDULE_COLUMNS, VESSEL_SUMMARY_COLUMNS
 from app.db.models.user import User
 from app.schemas import (
     Vessel,
@@ -74,16 +75,16 @@ def get_vessels(
         vessels = vessel_crud.search(
             db, query=search, organization_id=current_user.organization_id, skip=skip, limit=limit
         )
-        total = len(vessel_crud.search(
-            db, query=search, organization_id=current_user.organization_id, skip=0, limit=10000
-        ))
+        total = vessel_crud.count_search(
+            db, query=search, organization_id=current_user.organization_id
+        )
     elif vessel_type:
         vessels = vessel_crud.get_by_vessel_type(
             db, vessel_type=vessel_type, organization_id=current_user.organization_id, skip=skip, limit=limit
         )
-        total = len(vessel_crud.get_by_vessel_type(
-            db, vessel_type=vessel_type, organization_id=current_user.organization_id, skip=0, limit=10000
-        ))
+        total = vessel_crud.count_by_vessel_type(
+            db, vessel_type=vessel_type, organization_id=current_user.organization_id
+        )
     else:
         vessels = vessel_crud.get_by_organization(
             db, organization_id=current_user.organization_id, skip=skip, limit=limit
@@ -135,12 +136,11 @@ def create_vessel(
         )
     
     # Check if tag number already exists in organization
-    existing_vessel = vessel_crud.get_by_tag_number(
+    if vessel_crud.tag_number_exists(
         db, 
         tag_number=vessel_in.tag_number,
         organization_id=current_user.organization_id
-    )
-    if existing_vessel:
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Vessel with this tag number already exists in organization"
@@ -174,17 +174,18 @@ def get_vessel_dashboard(
     
     # Get critical vessels
     critical_vessels = vessel_crud.get_critical_vessels(
-        db, organization_id=current_user.organization_id
+        db, organization_id=current_user.organization_id, columns=VESSEL_SUMMARY_COLUMNS
     )
     
     # Get overdue inspections
     overdue_inspections = vessel_crud.get_overdue_for_inspection(
-        db, organization_id=current_user.organization_id
+        db, organization_id=current_user.organization_id, columns=VESSEL_SCHEDULE_COLUMNS
     )
     
     # Get inspections due soon
     due_soon_inspections = vessel_crud.get_due_for_inspection(
-        db, organization_id=current_user.organization_id, days_ahead=30
+        db, organization_id=current_user.organization_id, days_ahead=30,
+        columns=VESSEL_SCHEDULE_COLUMNS
     )
     
     # Get statistics
@@ -259,7 +260,7 @@ def get_critical_vessels(
         )
     
     vessels = vessel_crud.get_critical_vessels(
-        db, organization_id=current_user.organization_id
+        db, organization_id=current_user.organization_id, columns=VESSEL_SUMMARY_COLUMNS
     )
     
     return [VesselSummary.from_orm(v) for v in vessels]
@@ -280,7 +281,7 @@ def get_overdue_inspections(
         )
     
     vessels = vessel_crud.get_overdue_for_inspection(
-        db, organization_id=current_user.organization_id
+        db, organization_id=current_user.organization_id, columns=VESSEL_SCHEDULE_COLUMNS
     )
     
     def vessel_to_schedule(vessel):
@@ -321,7 +322,8 @@ def get_due_soon_inspections(
         )
     
     vessels = vessel_crud.get_due_for_inspection(
-        db, organization_id=current_user.organization_id, days_ahead=days_ahead
+        db, organization_id=current_user.organization_id, days_ahead=days_ahead,
+        columns=VESSEL_SCHEDULE_COLUMNS
     )
     
     def vessel_to_schedule(vessel):
@@ -465,12 +467,11 @@ def update_vessel(
     # Check for tag number conflicts
     if (vessel_in.tag_number and 
         vessel_in.tag_number != vessel.tag_number):
-        existing_vessel = vessel_crud.get_by_tag_number(
+        if vessel_crud.tag_number_exists(
             db,
             tag_number=vessel_in.tag_number,
             organization_id=vessel.organization_id
-        )
-        if existing_vessel:
+        ):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Vessel with this tag number already exists in organization"
@@ -11,7 +11,7 @@ import psutil
 import time
 from datetime import datetime
 
-from app.db.base import get_db
+from app.db.base import get_read_db, test_db_connection
 from app.core.config import settings
 
 router = APIRouter()
@@ -32,7 +32,7 @@ async def health_check() -> Dict[str, Any]:
 
 
 @router.get("/detailed")
-async def detailed_health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def detailed_health_check(db: Session = Depends(get_read_db)) -> Dict[str, Any]:
     """
     Detailed health check with dependency status.
     """
@@ -126,7 +126,7 @@ async def system_health_check() -> Dict[str, Any]:
 
 
 @router.get("/readiness")
-async def readiness_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def readiness_check() -> Dict[str, Any]:
     """
     Readiness check for Kubernetes/container orchestration.
     Returns 200 only if the service is ready to accept traffic.
@@ -134,13 +134,13 @@ async def readiness_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
     checks = []
     all_ready = True
     
-    # Database readiness
-    try:
-        db.execute(text("SELECT 1"))
+    # Database readiness; the probe result is cached briefly so frequent
+    # polling does not contend with requests for pooled connections
+    if test_db_connection():
         checks.append({"name": "database", "status": "ready"})
-    except Exception as e:
+    else:
         all_ready = False
-        checks.append({"name": "database", "status": "not_ready", "error": str(e)})
+        checks.append({"name": "database", "status": "not_ready", "error": "Database connection test failed"})
     
     # Redis readiness (only check if actually required for operations)
     # For development with in-memory rate limiting, Redis is optional
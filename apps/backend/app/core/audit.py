@@ -5,16 +5,13 @@ Provides comprehensive audit trails for all user actions,
 data modifications, and system events.
 """
 
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Union, List
 from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import Session, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.orm import Session
 
-from app.db.base import Base
 from app.core.logging_config import get_logger
+from app.services.audit_service import AuditLog, audit_service
 
 logger = get_logger(__name__)
 
@@ -55,59 +52,20 @@ class AuditSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-class AuditLog(Base):
-    """
-    Audit log model for tracking all user actions and system events.
-    """
-    __tablename__ = "audit_logs"
-
-    id = Column(Integer, primary_key=True, index=True)
-    
-    # Event identification
-    action = Column(SQLEnum(AuditAction), nullable=False, index=True)
-    severity = Column(SQLEnum(AuditSeverity), nullable=False, default=AuditSeverity.LOW)
-    description = Column(String(500), nullable=False)
-    
-    # User and session information
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
-    session_id = Column(String(255), nullable=True, index=True)
-    ip_address = Column(String(45), nullable=True)  # IPv6 compatible
-    user_agent = Column(Text, nullable=True)
-    
-    # Resource information
-    resource_type = Column(String(100), nullable=True, index=True)
-    resource_id = Column(String(100), nullable=True, index=True)
-    resource_name = Column(String(255), nullable=True)
-    
-    # Organization context
-    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=True, index=True)
-    
-    # Change tracking
-    old_values = Column(Text, nullable=True)  # JSON string
-    new_values = Column(Text, nullable=True)  # JSON string
-    
-    # Request information
-    request_id = Column(String(255), nullable=True, index=True)
-    endpoint = Column(String(255), nullable=True)
-    method = Column(String(10), nullable=True)
-    
-    # Result information
-    success = Column(String(10), nullable=False, default="true")  # true/false/error
-    error_message = Column(Text, nullable=True)
-    
-    # Timing
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
-    duration_ms = Column(Integer, nullable=True)
-    
-    # Additional context
-    additional_data = Column(Text, nullable=True)  # JSON string for extra context
-    
-    # Relationships
-    user = relationship("User", back_populates="audit_logs")
-    organization = relationship("Organization")
-
-    def __repr__(self) -> str:
-        return f"<AuditLog(id={self.id}, action={self.action}, user_id={self.user_id})>"
+# Event categories of the audit_logs table, as assigned by audit_service
+_ACTION_CATEGORIES = {
+    AuditAction.LOGIN: "authentication",
+    AuditAction.LOGOUT: "authentication",
+    AuditAction.LOGIN_FAILED: "authentication",
+    AuditAction.PASSWORD_CHANGE: "authentication",
+    AuditAction.PASSWORD_RESET: "authentication",
+    AuditAction.ACCOUNT_LOCK: "authentication",
+    AuditAction.ACCOUNT_UNLOCK: "authentication",
+    AuditAction.PERMISSION_GRANT: "admin",
+    AuditAction.PERMISSION_REVOKE: "admin",
+    AuditAction.ROLE_CHANGE: "admin",
+    AuditAction.SYSTEM_CONFIG_CHANGE: "admin",
+}
 
 
 class AuditService:
@@ -168,9 +126,21 @@ class AuditService:
             Created AuditLog instance
         """
         try:
+            # Everything the audit_logs table has no column for goes in details
+            details = {
+                "resource_name": resource_name,
+                "old_values": old_values,
+                "new_values": new_values,
+                "success": "true" if success else ("false" if not error_message else "error"),
+                "error_message": error_message,
+                "duration_ms": duration_ms,
+                "additional_data": additional_data
+            }
             audit_log = AuditLog(
-                action=action,
-                severity=severity,
+                event_type=action.value,
+                event_category=_ACTION_CATEGORIES.get(action, "data"),
+                severity=severity.value,
+                timestamp=datetime.now(timezone.utc),
                 description=description,
                 user_id=user_id,
                 session_id=session_id,
@@ -178,18 +148,13 @@ class AuditService:
                 user_agent=user_agent,
                 resource_type=resource_type,
                 resource_id=str(resource_id) if resource_id is not None else None,
-                resource_name=resource_name,
                 organization_id=organization_id,
-                old_values=json.dumps(old_values) if old_values else None,
-                new_values=json.dumps(new_values) if new_values else None,
+                details={key: value for key, value in details.items() if value is not None},
                 request_id=request_id,
-                endpoint=endpoint,
-                method=method,
-                success="true" if success else ("false" if not error_message else "error"),
-                error_message=error_message,
-                duration_ms=duration_ms,
-                additional_data=json.dumps(additional_data) if additional_data else None
+                api_endpoint=endpoint,
+                http_method=method
             )
+            audit_log.checksum = audit_service.calculate_checksum(audit_log)
             
             self.db.add(audit_log)
             self.db.commit()
@@ -197,8 +162,7 @@ class AuditService:
             
             # Also log to application logger for immediate visibility
             log_level = "ERROR" if not success else ("WARNING" if severity in [AuditSeverity.HIGH, AuditSeverity.CRITICAL] else "INFO")
-            logger.log(
-                getattr(logger, log_level.lower()),
+            getattr(logger, log_level.lower())(
                 f"AUDIT: {action.value} - {description} "
                 f"(user_id={user_id}, resource={resource_type}:{resource_id}, "
                 f"success={success})"
@@ -355,7 +319,7 @@ class AuditService:
         query = self.db.query(AuditLog).filter(AuditLog.user_id == user_id)
         
         if actions:
-            query = query.filter(AuditLog.action.in_(actions))
+            query = query.filter(AuditLog.event_type.in_([action.value for action in actions]))
         
         # Last N days
         from datetime import timedelta
@@ -397,10 +361,12 @@ class AuditService:
             AuditAction.PASSWORD_RESET
         ]
         
-        query = self.db.query(AuditLog).filter(AuditLog.action.in_(security_actions))
+        query = self.db.query(AuditLog).filter(
+            AuditLog.event_type.in_([action.value for action in security_actions])
+        )
         
         if severity:
-            query = query.filter(AuditLog.severity == severity)
+            query = query.filter(AuditLog.severity == severity.value)
         
         # Last N days
         from datetime import timedelta
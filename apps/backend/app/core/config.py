@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     SECRET_KEY: str = secrets.token_urlsafe(32)
     DEBUG: bool = False
+    NPLUSONE_RAISE: bool = False  # Fail DEBUG requests that hit N+1 lazy loads
     
     # Server
     HOST: str = "0.0.0.0"
@@ -32,6 +33,8 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 30  # 30 days
     ALGORITHM: str = "HS256"
+    BCRYPT_ROUNDS: Optional[int] = None  # None = calibrate at startup
+    BCRYPT_TARGET_MS: int = 250
     
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
@@ -51,11 +54,23 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "vessel_guard"
     POSTGRES_PORT: str = "5432"
     DATABASE_URL: Optional[str] = None
+    # Optional read replica for read-only request handlers
+    READ_REPLICA_URL: Optional[str] = None
     
     # SSL Configuration for Aiven
     POSTGRES_SSL_MODE: str = "disable"  # Can be: disable, require, verify-ca, verify-full
     POSTGRES_SSL_CERT_PATH: Optional[str] = None
     
+    # Connection pool, per worker process: DB_POOL_SIZE connections stay
+    # open, bursts borrow up to DB_MAX_OVERFLOW more (total per worker is
+    # the sum; WORKERS times that must fit the server's connection limit)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 25
+    # Recycle connections before the server's idle timeout (300s) drops
+    # them; pre-ping costs a round trip per checkout and is opt-in
+    DB_POOL_RECYCLE: int = 240
+    DB_POOL_PRE_PING: bool = False
+    
     @validator("DATABASE_URL", pre=True)
     def assemble_db_connection(cls, v: Optional[str], values: Dict[str, Any]) -> Any:
         if isinstance(v, str):
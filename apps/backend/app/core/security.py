@@ -5,10 +5,14 @@ Implements JWT tokens, password hashing, and security helpers
 following Azure security best practices.
 """
 
+import asyncio
+import os
 import secrets
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
 
 from jose import jwt
 from jose.exceptions import JWTError as InvalidTokenError
@@ -22,11 +26,34 @@ warnings.filterwarnings("ignore", message=".*error reading bcrypt version.*")
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
 
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt is CPU bound; one worker per core keeps hashing off the event loop
+# without oversubscribing the CPUs
+BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
+
+# Bounds for startup cost calibration. Calibration only ever raises the
+# cost above passlib's default; a lower cost must be set via BCRYPT_ROUNDS
+BCRYPT_MIN_ROUNDS = 12
+BCRYPT_MAX_ROUNDS = 16
+
+# Cheap cost benchmarked at startup and extrapolated from
+BCRYPT_BENCHMARK_ROUNDS = 10
+
+# bcrypt's minimum cost, for seeded development accounts only
+SEED_BCRYPT_ROUNDS = 4
+
 
 def create_access_token(
     subject: Union[str, Any], 
@@ -162,6 +189,102 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_seed_password_hash(password: str) -> str:
+    """
+    Generate password hash for a seeded account.
+    
+    Outside production, seeded accounts have well-known passwords, so
+    they are hashed at bcrypt's minimum cost to keep seeding fast. The
+    hashes still verify normally.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password
+    """
+    if settings.ENVIRONMENT == "production":
+        return get_password_hash(password)
+    
+    salt = bcrypt.gensalt(rounds=SEED_BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode(), salt).decode()
+
+
+async def run_in_bcrypt_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a call that hashes or verifies passwords on the bcrypt thread pool.
+    
+    Async endpoints use this so a slow bcrypt round does not stall every
+    other request on the event loop.
+    
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        Result of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(BCRYPT_POOL, lambda: func(*args, **kwargs))
+
+
+def calibrate_bcrypt_rounds(target_ms: int) -> int:
+    """
+    Find the bcrypt cost whose hash time is closest to a target.
+    
+    Each extra round doubles the hash time, so the cost is benchmarked
+    once at a cheap cost and extrapolated from there. The result never
+    drops below BCRYPT_MIN_ROUNDS, so a slow or busy host at startup
+    cannot weaken new hashes.
+    
+    Args:
+        target_ms: Target time per hash in milliseconds
+        
+    Returns:
+        Calibrated number of rounds
+    """
+    salt = bcrypt.gensalt(rounds=BCRYPT_BENCHMARK_ROUNDS)
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", salt)
+    elapsed_ms = max((time.perf_counter() - start) * 1000, 0.001)
+    
+    rounds = BCRYPT_BENCHMARK_ROUNDS
+    while rounds < BCRYPT_MAX_ROUNDS and elapsed_ms * 2 <= target_ms * 1.5:
+        elapsed_ms *= 2
+        rounds += 1
+    
+    if rounds < BCRYPT_MIN_ROUNDS:
+        logger.warning(
+            f"bcrypt cost {rounds} would meet the {target_ms} ms target; keeping "
+            f"{BCRYPT_MIN_ROUNDS}. Set BCRYPT_ROUNDS to use a lower cost"
+        )
+        rounds = BCRYPT_MIN_ROUNDS
+    return rounds
+
+
+def configure_password_hashing() -> int:
+    """
+    Apply the configured bcrypt cost, calibrating it when not set.
+    
+    Existing hashes keep verifying at their own cost; only new hashes
+    use the configured one.
+    
+    Returns:
+        Number of bcrypt rounds in use
+    """
+    global pwd_context
+    
+    rounds = settings.BCRYPT_ROUNDS
+    if rounds is None:
+        rounds = calibrate_bcrypt_rounds(settings.BCRYPT_TARGET_MS)
+        settings.BCRYPT_ROUNDS = rounds
+        logger.info(f"Calibrated bcrypt cost to {rounds} rounds (~{settings.BCRYPT_TARGET_MS} ms)")
+    
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+    return rounds
+
+
 def generate_password_reset_token(email: str) -> str:
     """
     Generate a password reset token.
@@ -0,0 +1,31 @@
+"""
+Time helpers.
+
+Provides a single timezone-aware source of the current UTC time, replacing
+the deprecated naive datetime.utcnow().
+"""
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Make a datetime timezone-aware, reading naive values as UTC.
+    
+    SQLite returns timezone-aware columns as naive UTC datetimes, while
+    PostgreSQL returns them aware; this lets either be compared to utcnow().
+    
+    Args:
+        value: Datetime to normalize
+        
+    Returns:
+        Timezone-aware datetime
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
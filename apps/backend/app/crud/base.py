@@ -5,11 +5,12 @@ Provides generic CRUD operations that can be inherited
 by specific model CRUD classes.
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Query, Session, selectinload
 from sqlalchemy.ext.declarative import DeclarativeMeta
 
 ModelType = TypeVar("ModelType", bound=DeclarativeMeta)
@@ -34,6 +35,21 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    def _with_relationships(self, query: Query, load: Sequence[str]) -> Query:
+        """
+        Eager-load relationships of the model with one SELECT ... IN each.
+        
+        Args:
+            query: Query over the model
+            load: Relationship attribute names to load
+            
+        Returns:
+            Query with selectinload options applied
+        """
+        if load:
+            query = query.options(*(selectinload(getattr(self.model, name)) for name in load))
+        return query
+
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         """
         Get record by ID.
@@ -115,6 +131,49 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.refresh(db_obj)
         return db_obj
 
+    def update_returning(
+        self,
+        db: Session,
+        *,
+        id: Any,
+        values: Dict[str, Any],
+        commit: bool = True
+    ) -> Optional[ModelType]:
+        """
+        Update record by ID with a single UPDATE ... RETURNING.
+        
+        The stored row, including server-side onupdate columns, comes back
+        with the UPDATE itself, so no refresh SELECT follows the commit.
+        
+        Args:
+            db: Database session
+            id: Record ID
+            values: Column name to value or SQL expression mapping
+            commit: Commit the transaction; False leaves it open for more writes
+            
+        Returns:
+            Updated model instance if found, None otherwise
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(values)
+            .returning(self.model)
+        )
+        # Sessions don't expire on commit, so the returned row must overwrite
+        # any copy already loaded; only a SELECT honours populate_existing
+        db_obj = db.execute(
+            select(self.model)
+            .from_statement(stmt)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if db_obj is None:
+            return None
+        
+        if commit:
+            db.commit()
+        return db_obj
+
     def delete(self, db: Session, *, id: int) -> ModelType:
         """
         Delete record by ID.
@@ -147,7 +206,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Total record count
         """
-        return db.query(self.model).count()
+        return db.query(func.count(self.model.id)).scalar()
 
     def exists(self, db: Session, *, id: int) -> bool:
         """
@@ -8,15 +8,44 @@ ASME calculations, stress analysis, and design verification.
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from sqlalchemy import and_, or_, func
+from sqlalchemy import JSON, String, and_, bindparam, cast, inspect, or_, func, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.crud.base import CRUDBase
-from app.db.models.calculation import Calculation
+from app.db.models.calculation import Calculation, CalculationResult
 from app.schemas.calculation import CalculationCreate, CalculationUpdate
+from app.utils.validation import LIKE_ESCAPE, contains_pattern
 from app.services.cache_service import cached_query, cache_service, CACHE_CONFIGS
 
 
+def _json_array_append(
+    column: Any, entry: Dict[str, Any], dialect_name: str
+) -> Optional[ColumnElement]:
+    """
+    Build a SQL expression appending an entry to a JSON array column.
+    
+    Args:
+        column: JSON column holding a list, or NULL
+        entry: Entry to append
+        dialect_name: Name of the database dialect
+        
+    Returns:
+        Expression for the updated array, or None if the dialect has none
+    """
+    if dialect_name == "postgresql":
+        appended = func.coalesce(cast(column, JSONB), cast("[]", JSONB)).op("||")(
+            cast(bindparam(None, [entry], type_=JSONB), JSONB)
+        )
+        return cast(appended, JSON)
+    if dialect_name == "sqlite":
+        return func.json_insert(
+            func.coalesce(column, "[]"), "$[#]", func.json(bindparam(None, entry, type_=JSON))
+        )
+    return None
+
 class CRUDCalculation(CRUDBase[Calculation, CalculationCreate, CalculationUpdate]):
     """CRUD operations for calculations with performance optimizations."""
 
@@ -208,7 +237,7 @@ class CRUDCalculation(CRUDBase[Calculation, CalculationCreate, CalculationUpdate
         limit: int = 100
     ) -> List[Calculation]:
         """Search calculations by name, description, or calculation type."""
-        search_term = f"%{query.lower()}%"
+        search_term = contains_pattern(query)
         
         return (
             db.query(self.model)
@@ -217,9 +246,9 @@ class CRUDCalculation(CRUDBase[Calculation, CalculationCreate, CalculationUpdate
                 and_(
                     self.model.vessel.has(organization_id=organization_id),
                     or_(
-                        func.lower(self.model.name).contains(search_term),
-                        func.lower(self.model.description).contains(search_term),
-                        func.lower(self.model.calculation_type).contains(search_term)
+                        self.model.name.ilike(search_term, escape=LIKE_ESCAPE),
+                        self.model.description.ilike(search_term, escape=LIKE_ESCAPE),
+                        cast(self.model.calculation_type, String).ilike(search_term, escape=LIKE_ESCAPE)
                     ),
                     self.model.is_active == True
                 )
@@ -333,19 +362,87 @@ class CRUDCalculation(CRUDBase[Calculation, CalculationCreate, CalculationUpdate
             return self.update(db, db_obj=calculation, obj_in=update_data)
         return None
 
+    def add_result_recommendation(
+        self,
+        db: Session,
+        *,
+        result: CalculationResult,
+        recommendation: str,
+        priority: str = "medium"
+    ) -> None:
+        """Append an engineering recommendation to a calculation result."""
+        self._append_result_entry(
+            db, result, "recommendations",
+            CalculationResult.recommendation_entry(recommendation, priority)
+        )
+
+    def add_result_warning(
+        self,
+        db: Session,
+        *,
+        result: CalculationResult,
+        warning: str,
+        severity: str = "medium"
+    ) -> None:
+        """Append a warning to a calculation result."""
+        self._append_result_entry(
+            db, result, "warnings", CalculationResult.warning_entry(warning, severity)
+        )
+
+    def _append_result_entry(
+        self, db: Session, result: CalculationResult, name: str, entry: Dict[str, Any]
+    ) -> None:
+        """
+        Append an entry to a JSON list column of a calculation result.
+        
+        Stored rows are appended to in the database by an UPDATE carrying
+        only the new entry, instead of rewriting the whole list on flush.
+        
+        Args:
+            db: Database session
+            result: Calculation result
+            name: JSON list column name
+            entry: Entry to append
+        """
+        state = inspect(result)
+        expression = None
+        # A pending assignment would be flushed over the appended row, so
+        # only append in SQL when the column has no unflushed changes
+        if state.persistent and not state.attrs[name].history.has_changes():
+            expression = _json_array_append(
+                getattr(CalculationResult, name), entry, db.get_bind().dialect.name
+            )
+        
+        if expression is None:
+            # Not stored yet, pending changes, or no in-place append on this
+            # dialect: assign a new list so the change is flushed with the row
+            setattr(result, name, [*(getattr(result, name) or []), entry])
+            return
+        
+        db.execute(
+            update(CalculationResult)
+            .where(CalculationResult.id == result.id)
+            .values({name: expression}),
+            execution_options={"synchronize_session": False}
+        )
+        
+        # Mirror the append on a loaded list without marking it dirty
+        if name in result.__dict__:
+            set_committed_value(result, name, [*(result.__dict__[name] or []), entry])
+
     def get_calculation_count_by_vessel(
         self, db: Session, *, vessel_id: int
     ) -> int:
         """Get count of calculations for a vessel."""
         return (
-            db.query(self.model)
+            db.query(func.count(self.model.id))
             .filter(
                 and_(
                     self.model.vessel_id == vessel_id,
                     self.model.is_active == True
                 )
             )
-            .count()
+            .scalar()
         )
 
     def get_calculation_count_by_organization(
@@ -353,7 +450,7 @@ class CRUDCalculation(CRUDBase[Calculation, CalculationCreate, CalculationUpdate
     ) -> int:
         """Get count of calculations for organization."""
         return (
-            db.query(self.model)
+            db.query(func.count(self.model.id))
             .join(self.model.vessel)
             .filter(
                 and_(
@@ -361,7 +458,7 @@ class CRUDCalculation(CRUDBase[Calculation, CalculationCreate, CalculationUpdate
                     self.model.is_active == True
                 )
             )
-            .count()
+            .scalar()
         )
 
 
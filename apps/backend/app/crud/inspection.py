@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 
 from sqlalchemy import and_, or_, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.crud.base import CRUDBase
 from app.db.models.inspection import Inspection, InspectionStatus, InspectionResult
@@ -27,6 +27,7 @@ class CRUDInspection(CRUDBase[Inspection, InspectionCreate, InspectionUpdate]):
         """Get inspections for a vessel."""
         return (
             db.query(self.model)
+            .options(selectinload(self.model.findings))
             .filter(
                 and_(
                     self.model.vessel_id == vessel_id,
@@ -51,6 +52,7 @@ class CRUDInspection(CRUDBase[Inspection, InspectionCreate, InspectionUpdate]):
         """Get inspections by type for organization."""
         return (
             db.query(self.model)
+            .options(selectinload(self.model.findings))
             .join(self.model.vessel)
             .filter(
                 and_(
@@ -71,6 +73,7 @@ class CRUDInspection(CRUDBase[Inspection, InspectionCreate, InspectionUpdate]):
         """Get inspections for a project."""
         return (
             db.query(self.model)
+            .options(selectinload(self.model.findings))
             .join(self.model.vessel)
             .filter(
                 and_(
@@ -205,6 +208,7 @@ class CRUDInspection(CRUDBase[Inspection, InspectionCreate, InspectionUpdate]):
         
         return (
             db.query(self.model)
+            .options(selectinload(self.model.findings))
             .join(self.model.vessel)
             .filter(
                 and_(
@@ -326,14 +330,14 @@ class CRUDInspection(CRUDBase[Inspection, InspectionCreate, InspectionUpdate]):
     ) -> int:
         """Get count of inspections for a vessel."""
         return (
-            db.query(self.model)
+            db.query(func.count(self.model.id))
             .filter(
                 and_(
                     self.model.vessel_id == vessel_id,
                     self.model.status != InspectionStatus.CANCELLED
                 )
             )
-            .count()
+            .scalar()
         )
 
     def get_inspection_count_by_organization(
@@ -341,7 +345,7 @@ class CRUDInspection(CRUDBase[Inspection, InspectionCreate, InspectionUpdate]):
     ) -> int:
         """Get count of inspections for organization."""
         return (
-            db.query(self.model)
+            db.query(func.count(self.model.id))
             .join(self.model.vessel)
             .filter(
                 and_(
@@ -349,7 +353,7 @@ class CRUDInspection(CRUDBase[Inspection, InspectionCreate, InspectionUpdate]):
                     self.model.status != InspectionStatus.CANCELLED
                 )
             )
-            .count()
+            .scalar()
         )
 
     def get_latest_inspection_by_vessel(
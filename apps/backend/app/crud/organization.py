@@ -5,16 +5,22 @@ Handles organization management including subscription tracking,
 member management, and usage limits.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
 
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.orm import Session
 
 from app.crud.base import CRUDBase
+from app.crud.user import invalidate_auth_cache_on_commit
 from app.db.models.organization import Organization
 from app.db.models.user import User
 from app.schemas.organization import OrganizationCreate, OrganizationUpdate
+from app.services.cache_service import cache_service
+
+# The default organization (the oldest one) only changes if it is deleted
+_DEFAULT_ORG_CACHE_KEY = "vessel_guard:organization:default_id"
+_DEFAULT_ORG_CACHE_TTL = 300
 
 
 class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUpdate]):
@@ -25,6 +31,40 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
     for subscription management and member handling.
     """
 
+    def get_default_id(self, db: Session) -> Optional[int]:
+        """
+        Get the ID of the default organization new users join.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Default organization ID, or None if no organization exists
+        """
+        org_id = cache_service.get(_DEFAULT_ORG_CACHE_KEY)
+        if org_id is not None:
+            return org_id
+        
+        org_id = db.query(func.min(Organization.id)).scalar()
+        if org_id is not None:
+            cache_service.set(_DEFAULT_ORG_CACHE_KEY, org_id, _DEFAULT_ORG_CACHE_TTL)
+        return org_id
+
+    def delete(self, db: Session, *, id: int) -> Organization:
+        """
+        Delete organization by ID.
+        
+        Args:
+            db: Database session
+            id: Organization ID
+            
+        Returns:
+            Deleted organization
+        """
+        org = super().delete(db, id=id)
+        cache_service.delete(_DEFAULT_ORG_CACHE_KEY)
+        return org
+
     def get_by_name(self, db: Session, *, name: str) -> Optional[Organization]:
         """
         Get organization by name.
@@ -96,17 +136,24 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
             .all()
         )
 
-    def get_expired_subscriptions(self, db: Session) -> List[Organization]:
+    def get_expired_subscriptions(
+        self, db: Session, *, batch_size: int = 500
+    ) -> Iterator[Organization]:
         """
-        Get organizations with expired subscriptions.
+        Stream organizations with expired subscriptions.
+        
+        Rows are fetched in batches so memory stays constant regardless
+        of how many organizations have expired; wrap in ``list()`` when
+        the full result set is needed at once.
         
         Args:
             db: Database session
+            batch_size: Number of rows fetched per round trip
             
-        Returns:
-            List of organizations with expired subscriptions
+        Yields:
+            Organizations with expired subscriptions
         """
-        return (
+        query = (
             db.query(Organization)
             .filter(
                 and_(
@@ -114,8 +161,10 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
                     Organization.subscription_expires_at < datetime.utcnow()
                 )
             )
-            .all()
+            .yield_per(batch_size)
         )
+        for org in query:
+            yield org
 
     def get_member_count(self, db: Session, *, organization_id: int) -> int:
         """
@@ -191,22 +240,19 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
         Raises:
             ValueError: If organization not found
         """
-        org = self.get_or_404(db, id=organization_id)
-        
-        org.subscription_tier = tier
-        org.subscription_expires_at = expires_at
+        values = {
+            Organization.subscription_tier: tier,
+            Organization.subscription_expires_at: expires_at,
+        }
         
         if max_members is not None:
-            org.max_members = max_members
+            values[Organization.max_members] = max_members
         if max_projects is not None:
-            org.max_projects = max_projects
+            values[Organization.max_projects] = max_projects
         if max_calculations_per_month is not None:
-            org.max_calculations_per_month = max_calculations_per_month
+            values[Organization.max_calculations_per_month] = max_calculations_per_month
         
-        db.add(org)
-        db.commit()
-        db.refresh(org)
-        return org
+        return self._update_returning(db, organization_id=organization_id, values=values)
 
     def reset_monthly_usage(self, db: Session, *, organization_id: int) -> Organization:
         """
@@ -358,10 +404,16 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
         # Deactivate organization
         org.is_active = False
         
-        # Deactivate all members
-        db.query(User).filter(User.organization_id == organization_id).update(
-            {"is_active": False}
-        )
+        # Deactivate all members; the UPDATE bypasses the ORM, so their
+        # cached auth data is dropped by ID once this commits
+        member_ids = db.scalars(
+            update(User)
+            .where(User.organization_id == organization_id)
+            .values(is_active=False)
+            .returning(User.id)
+        ).all()
+        for member_id in member_ids:
+            invalidate_auth_cache_on_commit(db, member_id)
         
         db.add(org)
         db.commit()
@@ -381,13 +433,43 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
         Returns:
             Reactivated organization
         """
-        org = self.get_or_404(db, id=organization_id)
+        return self._update_returning(
+            db, organization_id=organization_id, values={Organization.is_active: True}
+        )
+
+    def _update_returning(
+        self, db: Session, *, organization_id: int, values: dict
+    ) -> Organization:
+        """
+        Apply column updates with a single UPDATE ... RETURNING statement.
         
-        org.is_active = True
+        Args:
+            db: Database session
+            organization_id: Organization ID
+            values: Mapping of Organization columns to new values
+            
+        Returns:
+            Updated organization
+            
+        Raises:
+            ValueError: If organization not found
+        """
+        stmt = (
+            update(Organization)
+            .where(Organization.id == organization_id)
+            .values(values)
+            .returning(Organization)
+        )
+        org = db.execute(
+            select(Organization)
+            .from_statement(stmt)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if org is None:
+            db.rollback()
+            raise ValueError(f"Record with id {organization_id} not found")
         
-        db.add(org)
         db.commit()
-        db.refresh(org)
         return org
 
 
@@ -7,16 +7,282 @@ collaboration, and organization-based access control.
 UPDATED: Added field mapping for schema-model compatibility
 """
 
-from typing import List, Optional, Union, Dict, Any
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session
+from pydantic import BaseModel
+from sqlalchemy import and_, case, column, func, insert, inspect, or_, select, table, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.crud.base import CRUDBase
+from app.db.models.organization import Organization
 from app.db.models.project import Project
 from app.db.models.user import User
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.services.cache_service import cache_service
+from app.utils.validation import LIKE_ESCAPE, contains_pattern
+
+logger = logging.getLogger(__name__)
+
+# Status values used in hot filters; SQLAlchemy binds these as parameters
+# so each query keeps a single cached compiled form
+_STATUS_ACTIVE = "active"
+_TERMINAL_STATUSES = ("completed", "cancelled")
+
+# Shared filter clauses, built once at import and reused by every query
+_STATUS_IS_ACTIVE = Project.status == _STATUS_ACTIVE
+_NOT_TERMINAL = Project.status.notin_(_TERMINAL_STATUSES)
+
+def _is_postgresql(db: Session) -> bool:
+    """Check whether the session is bound to a PostgreSQL database."""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _overdue_predicate(now: Any) -> Any:
+    """
+    Build the clause matching open projects past their target date.
+    
+    Args:
+        now: Current time, as a Python datetime or SQL expression
+        
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    return and_(
+        Project.target_completion_date.isnot(None),
+        Project.target_completion_date < now,
+        _NOT_TERMINAL
+    )
+
+
+def _due_soon_predicate(now: Any, horizon: Any) -> Any:
+    """
+    Build the clause matching open projects due between now and horizon.
+    
+    Args:
+        now: Current time, as a Python datetime or SQL expression
+        horizon: Latest target date to include
+        
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    return and_(
+        Project.target_completion_date.isnot(None),
+        Project.target_completion_date <= horizon,
+        Project.target_completion_date >= now,
+        _NOT_TERMINAL
+    )
+
+
+# Dashboard statistics are cached briefly and dropped on project writes
+_STATISTICS_CACHE_TTL = 60
+
+
+# Organizations with at least this many projects read dashboard statistics
+# from the project_stats_by_org materialized view (PostgreSQL only), which
+# refresh_statistics_view() rebuilds every minute
+_STATISTICS_VIEW_MIN_PROJECTS = 10000
+
+_PROJECT_STATS_VIEW = table(
+    "project_stats_by_org",
+    column("organization_id"),
+    column("total_projects"),
+    column("active_projects"),
+    column("completed_projects"),
+    column("cancelled_projects"),
+    column("overdue_projects"),
+    column("due_soon_projects"),
+)
+
+
+@lru_cache(maxsize=None)
+def _statistics_view_exists(engine: Engine) -> bool:
+    """
+    Check once per engine whether the statistics materialized view exists.
+    
+    Only the Alembic migration creates the view; databases built by
+    init_db's create_all don't have it.
+    
+    Args:
+        engine: PostgreSQL engine
+        
+    Returns:
+        True if project_stats_by_org exists
+    """
+    return "project_stats_by_org" in inspect(engine).get_materialized_view_names()
+
+
+def _has_statistics_view(db: Session) -> bool:
+    """Check whether the session's PostgreSQL database has the statistics view."""
+    if not _is_postgresql(db):
+        return False
+    
+    bind = db.get_bind()
+    return _statistics_view_exists(getattr(bind, "engine", bind))
+
+
+@lru_cache(maxsize=None)
+def _trigram_extension_exists(engine: Engine) -> bool:
+    """
+    Check once per engine whether the pg_trgm extension is installed.
+    
+    Args:
+        engine: PostgreSQL engine
+        
+    Returns:
+        True if similarity() is available
+    """
+    with engine.connect() as conn:
+        return conn.scalar(
+            text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        )
+
+
+def _has_trigram_similarity(db: Session) -> bool:
+    """Check whether the session's PostgreSQL database has pg_trgm."""
+    if not _is_postgresql(db):
+        return False
+    
+    bind = db.get_bind()
+    return _trigram_extension_exists(getattr(bind, "engine", bind))
+
+
+def _statistics_cache_key(organization_id: int) -> str:
+    """Cache key for an organization's project statistics."""
+    # Lives under the org namespace so invalidate_organization_cache clears it
+    return f"vessel_guard:org:{organization_id}:project_statistics"
+
+
+# project_number -> id lookups are stable, so they are cached for longer
+_PROJECT_NUMBER_CACHE_TTL = 3600
+
+
+def _project_number_cache_key(organization_id: int, project_number: str) -> str:
+    """Cache key mapping an organization's project number to a project id."""
+    return f"vessel_guard:proj:{organization_id}:{project_number}"
+
+
+def _invalidate_statistics(*organization_ids: Optional[int]) -> None:
+    """Drop cached project statistics for the given organizations."""
+    for organization_id in set(organization_ids):
+        if organization_id is not None:
+            cache_service.delete(_statistics_cache_key(organization_id))
+
+
+def _memoize(cache: Optional[Dict[Any, Any]], key: Any, compute: Callable[[], Any]) -> Any:
+    """
+    Return a value from an optional request-scoped cache, computing it once.
+    
+    Args:
+        cache: Request cache dict, or None to bypass caching
+        key: Cache key
+        compute: Callable producing the value on a miss
+        
+    Returns:
+        Cached or freshly computed value
+    """
+    if cache is None:
+        return compute()
+    if key not in cache:
+        cache[key] = compute()
+    return cache[key]
+
+
+# Maximum bound parameters per IN clause, kept below driver limits
+_IN_CHUNK_SIZE = 500
+
+# Rows per INSERT in create_many
+_INSERT_BATCH_SIZE = 1000
+
+
+@lru_cache(maxsize=1)
+def _default_load_options() -> Tuple[Any, ...]:
+    """
+    Relationship loaders applied when callers will touch owner/organization.
+    
+    Built on first use: creating them configures the mappers, which needs
+    every model registered first.
+    """
+    return (
+        selectinload(Project.owner),
+        joinedload(Project.organization),
+    )
+
+
+# Schema status values mapped onto the ProjectStatus model enum
+_STATUS_MAPPING = {
+    "planning": "active",
+    "in_progress": "active",
+    "review": "active",
+    "completed": "completed",
+    "cancelled": "cancelled",
+    "on_hold": "on_hold",
+}
+
+# Schema field names that are stored under a different model column
+_FIELD_RENAMES = (
+    ("end_date", "target_completion_date"),
+    ("created_by_id", "owner_id"),
+)
+
+# Schema fields with no corresponding model column
+_DROP_FIELDS = ("budget",)
+
+# Assignable Project columns; excludes read-only properties such as is_active
+_PROJECT_COLUMNS = frozenset(Project.__table__.columns.keys())
+
+
+def _input_to_dict(obj_in: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert create/update input to a plain dict of explicitly set fields.
+    
+    Uses Pydantic v2's compiled ``model_dump`` in python mode so datetime
+    values stay native for the DateTime columns, falling back to
+    ``.dict()`` on v1 models. Dicts are copied so mapping never mutates
+    the caller's data.
+    
+    Args:
+        obj_in: Pydantic schema or dict
+        
+    Returns:
+        New dict of field values
+    """
+    if isinstance(obj_in, dict):
+        return obj_in.copy()
+    if hasattr(obj_in, 'model_dump'):
+        return obj_in.model_dump(exclude_unset=True, mode='python')
+    return obj_in.dict(exclude_unset=True)
+
+
+def _apply_field_mapping(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map schema field names and status values onto Project model columns.
+    
+    Renamed fields are only carried over when they hold a value, so an
+    explicit ``None`` never clears the target column.
+    
+    Args:
+        data: Field data taken from a create or update schema
+        
+    Returns:
+        The same dict, mutated in place for model assignment
+    """
+    for source, target in _FIELD_RENAMES:
+        if source in data:
+            value = data.pop(source)
+            if value is not None:
+                data[target] = value
+    
+    for field in _DROP_FIELDS:
+        data.pop(field, None)
+    
+    if 'status' in data:
+        data['status'] = _STATUS_MAPPING.get(data['status'], data['status'])
+    
+    return data
 
 
 class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
@@ -34,68 +300,58 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Maps schema fields to model fields, handling the end_date -> target_completion_date
         mapping and other field transformations.
         """
-        from fastapi.encoders import jsonable_encoder
-        
         # Convert input to dict and handle field mapping
-        if isinstance(obj_in, dict):
-            obj_in_data = obj_in.copy()
-        else:
-            obj_in_data = jsonable_encoder(obj_in)
+        obj_in_data = _apply_field_mapping(_input_to_dict(obj_in))
         
-        print(f"DEBUG: Original obj_in_data keys: {list(obj_in_data.keys())}")  # Debug log
-        print(f"DEBUG: Original obj_in_data: {obj_in_data}")  # Debug log
-        
-        # Map end_date to target_completion_date if present
-        if 'end_date' in obj_in_data and obj_in_data['end_date'] is not None:
-            obj_in_data['target_completion_date'] = obj_in_data.pop('end_date')
-            print(f"DEBUG: Mapped end_date to target_completion_date")  # Debug log
-        else:
-            print(f"DEBUG: No end_date found or it was None")  # Debug log
-        
-        # Map created_by_id to owner_id if present
-        if 'created_by_id' in obj_in_data:
-            obj_in_data['owner_id'] = obj_in_data.pop('created_by_id')
-            print(f"DEBUG: Mapped created_by_id to owner_id")  # Debug log
-        else:
-            print(f"DEBUG: No created_by_id found")  # Debug log
-        
-        # Remove budget field as it's not in the Project model
-        if 'budget' in obj_in_data:
-            budget_value = obj_in_data.pop('budget')
-            print(f"DEBUG: Removed budget field (value: {budget_value})")  # Debug log
-        
-        # Map status values from schema to model enum
-        status_mapping = {
-            "planning": "active",
-            "in_progress": "active", 
-            "review": "active",
-            "completed": "completed",
-            "cancelled": "cancelled",
-            "on_hold": "on_hold"
-        }
-        if 'status' in obj_in_data and obj_in_data['status'] in status_mapping:
-            original_status = obj_in_data['status']
-            mapped_status = status_mapping[obj_in_data['status']]
-            obj_in_data['status'] = mapped_status
-            print(f"DEBUG: Mapped status from {original_status} to {mapped_status}")  # Debug log
-        
-        print(f"DEBUG: Final obj_in_data keys: {list(obj_in_data.keys())}")  # Debug log
-        print(f"DEBUG: Final obj_in_data: {obj_in_data}")  # Debug log
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating project with fields: %s", obj_in_data)
         
         # Create the project with mapped fields
         try:
             db_obj = Project(**obj_in_data)
-            print(f"DEBUG: Project created successfully")  # Debug log
         except Exception as e:
-            print(f"DEBUG: Error creating Project: {e}")  # Debug log
-            print(f"DEBUG: Problematic keys: {list(obj_in_data.keys())}")  # Debug log
+            logger.error("Error creating Project with fields %s: %s", list(obj_in_data), e)
             raise
         
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        _invalidate_statistics(db_obj.organization_id)
         return db_obj
 
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: List[Union[ProjectCreate, Dict[str, Any]]],
+        batch_size: int = _INSERT_BATCH_SIZE
+    ) -> List[int]:
+        """
+        Create many projects with batched INSERT statements.
+        
+        Applies the same field mapping as create() but skips per-row ORM
+        flushes, committing once after all batches are inserted.
+        
+        Args:
+            db: Database session
+            objs_in: Project creation data (schemas or dicts)
+            batch_size: Number of rows sent per INSERT
+            
+        Returns:
+            IDs of the created projects, in input order
+        """
+        rows = [_apply_field_mapping(_input_to_dict(obj_in)) for obj_in in objs_in]
+        
+        ids: List[int] = []
+        stmt = insert(Project).returning(Project.id, sort_by_parameter_order=True)
+        for start in range(0, len(rows), batch_size):
+            result = db.execute(stmt, rows[start:start + batch_size])
+            ids.extend(result.scalars().all())
+        
+        db.commit()
+        _invalidate_statistics(*(row.get("organization_id") for row in rows))
+        return ids
+
     def update(self, db: Session, *, db_obj: Project, obj_in: Union[ProjectUpdate, Dict[str, Any]]) -> Project:
         """
         Update project with field mapping.
@@ -103,48 +359,37 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Maps schema fields to model fields, handling the end_date -> target_completion_date
         mapping and other field transformations.
         """
-        from fastapi.encoders import jsonable_encoder
-        
         # Convert schema to dict and handle field mapping
-        obj_data = jsonable_encoder(db_obj)
-        
-        if isinstance(obj_in, dict):
-            update_data = obj_in.copy()
-        else:
-            update_data = obj_in.dict(exclude_unset=True)
-        
-        # Map end_date to target_completion_date if present
-        if 'end_date' in update_data and update_data['end_date'] is not None:
-            update_data['target_completion_date'] = update_data.pop('end_date')
-        
-        # Map created_by_id to owner_id if present
-        if 'created_by_id' in update_data:
-            update_data['owner_id'] = update_data.pop('created_by_id')
-        
-        # Map status values from schema to model enum
-        status_mapping = {
-            "planning": "active",
-            "in_progress": "active", 
-            "review": "active",
-            "completed": "completed",
-            "cancelled": "cancelled",
-            "on_hold": "on_hold"
-        }
-        if 'status' in update_data and update_data['status'] in status_mapping:
-            update_data['status'] = status_mapping[update_data['status']]
+        update_data = _apply_field_mapping(_input_to_dict(obj_in))
+        previous_organization_id = db_obj.organization_id
+        previous_project_number = db_obj.project_number
         
         # Update fields
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        for field, value in update_data.items():
+            if field in _PROJECT_COLUMNS:
+                setattr(db_obj, field, value)
         
-        db.add(db_obj)
+        # db_obj is already tracked by this session; commit flushes the changes
         db.commit()
         db.refresh(db_obj)
+        _invalidate_statistics(previous_organization_id, db_obj.organization_id)
+        if previous_project_number and (
+            previous_project_number != db_obj.project_number
+            or previous_organization_id != db_obj.organization_id
+        ):
+            cache_service.delete(
+                _project_number_cache_key(previous_organization_id, previous_project_number)
+            )
         return db_obj
 
     def get_by_organization(
-        self, db: Session, *, organization_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        organization_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        eager: bool = False
     ) -> List[Project]:
         """
         Get projects by organization.
@@ -154,20 +399,32 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             organization_id: Organization ID
             skip: Number of records to skip
             limit: Maximum records to return
+            eager: Eager-load owner and organization relationships
             
         Returns:
             List of projects in organization
         """
+        query = db.query(Project)
+        if eager:
+            query = query.options(*_default_load_options())
+        
         return (
-            db.query(Project)
+            query
             .filter(Project.organization_id == organization_id)
+            .order_by(Project.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
     def get_active_by_organization(
-        self, db: Session, *, organization_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        organization_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        eager: bool = False
     ) -> List[Project]:
         """
         Get active projects by organization.
@@ -177,25 +434,37 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             organization_id: Organization ID
             skip: Number of records to skip
             limit: Maximum records to return
+            eager: Eager-load owner and organization relationships
             
         Returns:
             List of active projects in organization
         """
+        query = db.query(Project)
+        if eager:
+            query = query.options(*_default_load_options())
+        
         return (
-            db.query(Project)
+            query
             .filter(
                 and_(
                     Project.organization_id == organization_id,
-                    Project.status == "active"
+                    _STATUS_IS_ACTIVE
                 )
             )
+            .order_by(Project.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
     def get_by_owner(
-        self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        eager: bool = False
     ) -> List[Project]:
         """
         Get projects by owner.
@@ -205,13 +474,19 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             owner_id: Owner user ID
             skip: Number of records to skip
             limit: Maximum records to return
+            eager: Eager-load owner and organization relationships
             
         Returns:
             List of projects owned by user
         """
+        query = db.query(Project)
+        if eager:
+            query = query.options(*_default_load_options())
+        
         return (
-            db.query(Project)
+            query
             .filter(Project.owner_id == owner_id)
+            .order_by(Project.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -241,10 +516,10 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         """
         query = db.query(Project).filter(Project.status == status)
         
-        if organization_id:
+        if organization_id is not None:
             query = query.filter(Project.organization_id == organization_id)
         
-        return query.offset(skip).limit(limit).all()
+        return query.order_by(Project.id.desc()).offset(skip).limit(limit).all()
 
     def get_overdue_projects(
         self, db: Session, *, organization_id: Optional[int] = None
@@ -259,18 +534,11 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Returns:
             List of overdue projects
         """
-        query = db.query(Project).filter(
-            and_(
-                Project.target_completion_date.isnot(None),
-                Project.target_completion_date < datetime.utcnow(),
-                Project.status.notin_(["completed", "cancelled"])
-            )
+        return (
+            db.query(Project)
+            .filter(*self._overdue_filter(db, organization_id))
+            .all()
         )
-        
-        if organization_id:
-            query = query.filter(Project.organization_id == organization_id)
-        
-        return query.all()
 
     def get_due_soon(
         self,
@@ -290,23 +558,102 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Returns:
             List of projects due within specified days
         """
+        return (
+            db.query(Project)
+            .filter(*self._due_soon_filter(db, organization_id, days_ahead))
+            .all()
+        )
+
+    def _overdue_filter(
+        self, db: Session, organization_id: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Build the WHERE predicates selecting overdue projects.
+        
+        Args:
+            db: Database session
+            organization_id: Optional organization filter
+            
+        Returns:
+            List of SQLAlchemy filter expressions
+        """
+        # PostgreSQL evaluates now() server-side, keeping the SQL text stable
+        now = func.now() if _is_postgresql(db) else datetime.utcnow()
+        predicates = [_overdue_predicate(now)]
+        if organization_id is not None:
+            predicates.append(Project.organization_id == organization_id)
+        return predicates
+
+    def _due_soon_filter(
+        self, db: Session, organization_id: Optional[int] = None, days_ahead: int = 7
+    ) -> List[Any]:
+        """
+        Build the WHERE predicates selecting projects due soon.
+        
+        Args:
+            db: Database session
+            organization_id: Optional organization filter
+            days_ahead: Number of days to look ahead
+            
+        Returns:
+            List of SQLAlchemy filter expressions
+        """
         from datetime import timedelta
         
-        future_date = datetime.utcnow() + timedelta(days=days_ahead)
+        if _is_postgresql(db):
+            now = func.now()
+            horizon = now + func.make_interval(0, 0, 0, days_ahead)
+        else:
+            now = datetime.utcnow()
+            horizon = now + timedelta(days=days_ahead)
         
-        query = db.query(Project).filter(
-            and_(
-                Project.target_completion_date.isnot(None),
-                Project.target_completion_date <= future_date,
-                Project.target_completion_date >= datetime.utcnow(),
-                Project.status.notin_(["completed", "cancelled"])
-            )
-        )
+        predicates = [_due_soon_predicate(now, horizon)]
+        if organization_id is not None:
+            predicates.append(Project.organization_id == organization_id)
+        return predicates
+
+    def count_overdue_projects(
+        self, db: Session, *, organization_id: Optional[int] = None
+    ) -> int:
+        """
+        Count projects that are overdue.
         
-        if organization_id:
-            query = query.filter(Project.organization_id == organization_id)
+        Args:
+            db: Database session
+            organization_id: Optional organization filter
+            
+        Returns:
+            Number of overdue projects
+        """
+        return (
+            db.query(func.count(Project.id))
+            .filter(*self._overdue_filter(db, organization_id))
+            .scalar()
+        )
+
+    def count_due_soon(
+        self,
+        db: Session,
+        *,
+        days_ahead: int = 7,
+        organization_id: Optional[int] = None
+    ) -> int:
+        """
+        Count projects due soon.
         
-        return query.all()
+        Args:
+            db: Database session
+            days_ahead: Number of days to look ahead
+            organization_id: Optional organization filter
+            
+        Returns:
+            Number of projects due within specified days
+        """
+        return (
+            db.query(func.count(Project.id))
+            .filter(*self._due_soon_filter(db, organization_id, days_ahead))
+            .scalar()
+        )
 
     def search(
         self,
@@ -315,8 +662,9 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         query: str,
         organization_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Project]:
+        limit: int = 100,
+        with_total: bool = False
+    ) -> Union[List[Project], Tuple[List[Project], int]]:
         """
         Search projects by name or description.
         
@@ -326,22 +674,57 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             organization_id: Optional organization filter
             skip: Number of records to skip
             limit: Maximum records to return
+            with_total: Also return the total match count, computed in the
+                same query with a window function
             
         Returns:
-            List of matching projects
+            List of matching projects, or a (projects, total) tuple when
+            with_total is set
         """
-        search_term = f"%{query}%"
+        # On PostgreSQL each ILIKE is served by a pg_trgm GIN index
+        # (see the add_project_trigram_indexes migration)
+        search_term = contains_pattern(query)
         db_query = db.query(Project).filter(
             or_(
-                Project.name.ilike(search_term),
-                Project.description.ilike(search_term),
-                Project.project_number.ilike(search_term)
+                Project.name.ilike(search_term, escape=LIKE_ESCAPE),
+                Project.description.ilike(search_term, escape=LIKE_ESCAPE),
+                Project.project_number.ilike(search_term, escape=LIKE_ESCAPE)
             )
         )
         
-        if organization_id:
+        if organization_id is not None:
             db_query = db_query.filter(Project.organization_id == organization_id)
         
+        # Rank closest matches first where pg_trgm is installed. This sorts
+        # every matching row before OFFSET/LIMIT apply; newest-first id
+        # ordering keeps offset pagination stable
+        if _has_trigram_similarity(db):
+            db_query = db_query.order_by(
+                func.greatest(
+                    func.similarity(Project.name, query),
+                    func.similarity(func.coalesce(Project.description, ""), query),
+                    func.similarity(func.coalesce(Project.project_number, ""), query)
+                ).desc(),
+                Project.id.desc()
+            )
+        else:
+            db_query = db_query.order_by(Project.id.desc())
+        
+        if with_total:
+            rows = (
+                db_query.add_columns(func.count().over().label("total"))
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+            if rows:
+                return [row[0] for row in rows], rows[0][1]
+            # Empty page: no matches at all, or skip past the end, in which
+            # case the total still needs counting
+            if skip == 0:
+                return [], 0
+            return [], db_query.order_by(None).with_entities(func.count(Project.id)).scalar()
+        
         return db_query.offset(skip).limit(limit).all()
 
     def get_by_project_number(
@@ -358,7 +741,21 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Returns:
             Project if found, None otherwise
         """
-        return (
+        # Only the id is cached; the row comes from the identity map or a
+        # primary key lookup, and a stale mapping falls through to the query
+        cache_key = _project_number_cache_key(organization_id, project_number)
+        cached_id = cache_service.get(cache_key)
+        if cached_id is not None:
+            project = db.get(Project, cached_id)
+            if (
+                project is not None
+                and project.project_number == project_number
+                and project.organization_id == organization_id
+            ):
+                return project
+            cache_service.delete(cache_key)
+        
+        project = (
             db.query(Project)
             .filter(
                 and_(
@@ -368,6 +765,45 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             )
             .first()
         )
+        if project is not None:
+            cache_service.set(cache_key, project.id, ttl=_PROJECT_NUMBER_CACHE_TTL)
+        return project
+
+    def get_by_project_numbers(
+        self, db: Session, *, project_numbers: List[str], organization_id: int
+    ) -> Dict[str, Project]:
+        """
+        Get several projects by project number within organization.
+        
+        Issues one IN query per chunk of numbers instead of one query
+        per number.
+        
+        Args:
+            db: Database session
+            project_numbers: Project numbers to look up
+            organization_id: Organization ID
+            
+        Returns:
+            Mapping of project number to project for the numbers found
+        """
+        numbers = list(dict.fromkeys(project_numbers))
+        projects: Dict[str, Project] = {}
+        
+        for start in range(0, len(numbers), _IN_CHUNK_SIZE):
+            chunk = numbers[start:start + _IN_CHUNK_SIZE]
+            rows = (
+                db.query(Project)
+                .filter(
+                    and_(
+                        Project.organization_id == organization_id,
+                        Project.project_number.in_(chunk)
+                    )
+                )
+                .all()
+            )
+            projects.update((p.project_number, p) for p in rows)
+        
+        return projects
 
     def update_status(
         self, db: Session, *, project_id: int, status: str, updated_by_id: int
@@ -384,20 +820,33 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Returns:
             Updated project
         """
-        project = self.get(db, id=project_id)
-        if not project:
-            raise ValueError(f"Project with ID {project_id} not found")
-        
-        project.status = status
         # Note: The model doesn't have updated_by_id field, so we skip that
+        values = {Project.status: status}
+        
+        # Set completion date if completed, keeping an existing one
+        if status == "completed":
+            values[Project.actual_completion_date] = func.coalesce(
+                Project.actual_completion_date, func.now()
+            )
         
-        # Set completion date if completed
-        if status == "completed" and not project.actual_completion_date:
-            project.actual_completion_date = datetime.utcnow()
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        stmt = (
+            update(Project)
+            .where(Project.id == project_id)
+            .values(values)
+            .returning(Project)
+        )
+        project = db.execute(
+            select(Project)
+            .from_statement(stmt)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if project is None:
+            db.rollback()
+            raise ValueError(f"Project with ID {project_id} not found")
         
-        db.add(project)
         db.commit()
-        db.refresh(project)
+        _invalidate_statistics(project.organization_id)
         return project
 
     def complete_project(
@@ -419,7 +868,11 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         )
 
     def get_project_count_by_organization(
-        self, db: Session, *, organization_id: int
+        self,
+        db: Session,
+        *,
+        organization_id: int,
+        cache: Optional[Dict[Any, Any]] = None
     ) -> int:
         """
         Get total project count for organization.
@@ -427,18 +880,27 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Args:
             db: Database session
             organization_id: Organization ID
+            cache: Optional request-scoped cache to reuse the result
             
         Returns:
             Total project count
         """
-        return (
-            db.query(func.count(Project.id))
-            .filter(Project.organization_id == organization_id)
-            .scalar()
+        return _memoize(
+            cache,
+            ("project_count", organization_id),
+            lambda: (
+                db.query(func.count(Project.id))
+                .filter(Project.organization_id == organization_id)
+                .scalar()
+            )
         )
 
     def get_active_project_count_by_organization(
-        self, db: Session, *, organization_id: int
+        self,
+        db: Session,
+        *,
+        organization_id: int,
+        cache: Optional[Dict[Any, Any]] = None
     ) -> int:
         """
         Get active project count for organization.
@@ -446,45 +908,97 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Args:
             db: Database session
             organization_id: Organization ID
+            cache: Optional request-scoped cache to reuse the result
             
         Returns:
             Active project count
         """
-        return (
-            db.query(func.count(Project.id))
-            .filter(
-                and_(
-                    Project.organization_id == organization_id,
-                    Project.status == "active"
+        return _memoize(
+            cache,
+            ("active_project_count", organization_id),
+            lambda: (
+                db.query(func.count(Project.id))
+                .filter(
+                    and_(
+                        Project.organization_id == organization_id,
+                        _STATUS_IS_ACTIVE
+                    )
                 )
+                .scalar()
             )
-            .scalar()
         )
 
-    def can_create_project(self, db: Session, *, organization_id: int) -> bool:
+    def can_create_project(
+        self,
+        db: Session,
+        *,
+        organization_id: int,
+        cache: Optional[Dict[Any, Any]] = None
+    ) -> bool:
         """
         Check if organization can create a new project.
         
         Args:
             db: Database session
             organization_id: Organization ID
+            cache: Optional request-scoped cache to reuse the result
             
         Returns:
             True if organization can create projects, False otherwise
         """
-        from app.crud.organization import organization as org_crud
+        return _memoize(
+            cache,
+            ("can_create_project", organization_id),
+            lambda: self._can_create_project(db, organization_id=organization_id)
+        )
+
+    def _can_create_project(self, db: Session, *, organization_id: int) -> bool:
+        """Evaluate the project-limit check against the database."""
+        # Fetch organization status, limit and active count in one round trip.
+        # The count only scans up to max_projects rows: reaching the limit is
+        # all that matters, so the database can stop there.
+        max_projects_limit = (
+            select(Organization.max_projects)
+            .where(Organization.id == organization_id)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        capped_active = (
+            select(Project.id)
+            .where(
+                and_(
+                    Project.organization_id == organization_id,
+                    _STATUS_IS_ACTIVE
+                )
+            )
+            .limit(max_projects_limit)
+            .subquery()
+        )
+        active_count = select(func.count()).select_from(capped_active).scalar_subquery()
+        # Only count when the result can matter: inactive organizations are
+        # rejected and a NULL limit accepts regardless of the count
+        needed_count = case(
+            (
+                and_(Organization.is_active == True, Organization.max_projects.isnot(None)),
+                active_count
+            ),
+            else_=None
+        )
+        row = (
+            db.query(Organization.is_active, Organization.max_projects, needed_count)
+            .filter(Organization.id == organization_id)
+            .first()
+        )
+        if not row:
+            return False
         
-        org = org_crud.get(db, id=organization_id)
-        if not org or not org.is_active:
+        is_active, max_projects, current_count = row
+        if not is_active:
             return False
         
         # Check project limit
-        if org.max_projects:
-            current_count = self.get_active_project_count_by_organization(
-                db, organization_id=organization_id
-            )
-            if current_count >= org.max_projects:
-                return False
+        if max_projects is not None and current_count >= max_projects:
+            return False
         
         return True
 
@@ -494,7 +1008,8 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         *,
         organization_id: int,
         days: int = 30,
-        limit: int = 10
+        limit: int = 10,
+        eager: bool = False
     ) -> List[Project]:
         """
         Get recently created projects.
@@ -504,6 +1019,7 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             organization_id: Organization ID
             days: Number of days to look back
             limit: Maximum projects to return
+            eager: Eager-load owner and organization relationships
             
         Returns:
             List of recent projects
@@ -512,8 +1028,12 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
+        query = db.query(Project)
+        if eager:
+            query = query.options(*_default_load_options())
+        
         return (
-            db.query(Project)
+            query
             .filter(
                 and_(
                     Project.organization_id == organization_id,
@@ -531,6 +1051,9 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         """
         Get project statistics for organization.
         
+        Results are cached for a short TTL and invalidated by project
+        writes made through this CRUD.
+        
         Args:
             db: Database session
             organization_id: Organization ID
@@ -538,30 +1061,83 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         Returns:
             Dictionary with project statistics
         """
-        total_projects = self.get_project_count_by_organization(
-            db, organization_id=organization_id
-        )
-        active_projects = self.get_active_project_count_by_organization(
-            db, organization_id=organization_id
-        )
+        cache_key = _statistics_cache_key(organization_id)
+        cached = cache_service.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Count by status
-        status_counts = {}
-        for status in ["planning", "in_progress", "review", "completed", "cancelled"]:
-            count = (
-                db.query(func.count(Project.id))
-                .filter(
-                    and_(
-                        Project.organization_id == organization_id,
-                        Project.status == status
-                    )
-                )
-                .scalar()
+        statistics = None
+        if _has_statistics_view(db):
+            statistics = self._get_precomputed_statistics(db, organization_id=organization_id)
+        if statistics is None:
+            statistics = self._compute_statistics(db, organization_id=organization_id)
+        
+        cache_service.set(cache_key, statistics, ttl=_STATISTICS_CACHE_TTL)
+        return statistics
+
+    def _get_precomputed_statistics(
+        self, db: Session, *, organization_id: int
+    ) -> Optional[dict]:
+        """
+        Read statistics from the project_stats_by_org materialized view.
+        
+        Only large organizations are served from the view; smaller ones
+        are cheap to aggregate live and get up-to-date numbers.
+        
+        Args:
+            db: Database session
+            organization_id: Organization ID
+            
+        Returns:
+            Statistics dictionary, or None to fall back to live aggregation
+        """
+        row = db.execute(
+            select(_PROJECT_STATS_VIEW)
+            .where(_PROJECT_STATS_VIEW.c.organization_id == organization_id)
+        ).first()
+        if row is None or row.total_projects < _STATISTICS_VIEW_MIN_PROJECTS:
+            return None
+        
+        return {
+            "total_projects": row.total_projects,
+            "active_projects": row.active_projects,
+            "status_breakdown": {
+                "planning": 0,
+                "in_progress": 0,
+                "review": 0,
+                "completed": row.completed_projects,
+                "cancelled": row.cancelled_projects
+            },
+            "overdue_projects": row.overdue_projects,
+            "due_soon_projects": row.due_soon_projects
+        }
+
+    def _compute_statistics(self, db: Session, *, organization_id: int) -> dict:
+        """Aggregate project statistics for an organization from the projects table."""
+        # One grouped query: per-status counts, with overdue/due-soon counted
+        # per group via FILTER aggregates and summed across groups below
+        rows = (
+            db.query(
+                Project.status,
+                func.count(Project.id),
+                func.count(Project.id).filter(*self._overdue_filter(db)),
+                func.count(Project.id).filter(*self._due_soon_filter(db))
             )
-            status_counts[status] = count
+            .filter(Project.organization_id == organization_id)
+            .group_by(Project.status)
+            .all()
+        )
+        counts = {getattr(status, "value", status): count for status, count, _, _ in rows}
+        
+        total_projects = sum(counts.values())
+        active_projects = counts.get(_STATUS_ACTIVE, 0)
+        status_counts = {
+            status: counts.get(status, 0)
+            for status in ["planning", "in_progress", "review", "completed", "cancelled"]
+        }
         
-        overdue_count = len(self.get_overdue_projects(db, organization_id=organization_id))
-        due_soon_count = len(self.get_due_soon(db, organization_id=organization_id))
+        overdue_count = sum(row[2] for row in rows)
+        due_soon_count = sum(row[3] for row in rows)
         
         return {
             "total_projects": total_projects,
@@ -571,6 +1147,23 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
             "due_soon_projects": due_soon_count
         }
 
+    def refresh_statistics_view(self, db: Session) -> None:
+        """
+        Rebuild the project_stats_by_org materialized view.
+        
+        Refreshes concurrently so dashboard reads are not blocked. No-op
+        on databases other than PostgreSQL and on ones created without
+        the migration that adds the view.
+        
+        Args:
+            db: Database session
+        """
+        if not _has_statistics_view(db):
+            return
+        
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY project_stats_by_org"))
+        db.commit()
+
 
 # Create instance for dependency injection
 project = CRUDProject(Project)
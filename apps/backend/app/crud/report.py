@@ -8,12 +8,32 @@ vessels, calculations, and inspections.
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 
-from sqlalchemy import and_, or_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import String, and_, cast, or_, func
+from sqlalchemy.orm import Session, contains_eager, defer
 
 from app.crud.base import CRUDBase
 from app.db.models.report import Report
 from app.schemas.report import ReportCreate, ReportUpdate
+from app.utils.validation import LIKE_ESCAPE, contains_pattern
+
+
+# Large generation payloads that list responses never read; detail lookups
+# through get() still load the full row
+_LIST_DEFERRED_COLUMNS = (
+    Report.report_parameters,
+    Report.sections,
+    Report.summary,
+    Report.digital_signature,
+)
+
+
+def _project_list_options() -> list:
+    """Loader options for report lists that already join Project."""
+    # Populate Report.project from the joined row instead of lazy loading it
+    # per report
+    options = [contains_eager(Report.project)]
+    options.extend(defer(column) for column in _LIST_DEFERRED_COLUMNS)
+    return options
 
 
 class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
@@ -52,6 +72,7 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         return (
             db.query(self.model)
             .join(Project, self.model.project_id == Project.id)
+            .options(*_project_list_options())
             .filter(
                 and_(
                     self.model.report_type == report_type,
@@ -68,12 +89,12 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         self, db: Session, *, project_id: int, skip: int = 0, limit: int = 100
     ) -> List[Report]:
         """Get reports for a project."""
+        # Reports reference their project directly, so no join is needed
         return (
             db.query(self.model)
-            .join(self.model.vessel)
             .filter(
                 and_(
-                    self.model.vessel.has(project_id=project_id),
+                    self.model.project_id == project_id,
                     self.model.is_active == True
                 )
             )
@@ -136,6 +157,7 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         return (
             db.query(self.model)
             .join(Project, self.model.project_id == Project.id)
+            .options(*_project_list_options())
             .filter(
                 and_(
                     Project.organization_id == organization_id,
@@ -161,6 +183,7 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         return (
             db.query(self.model)
             .join(Project, self.model.project_id == Project.id)
+            .options(*_project_list_options())
             .filter(
                 and_(
                     Project.organization_id == organization_id,
@@ -187,6 +210,7 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         return (
             db.query(self.model)
             .join(Project, self.model.project_id == Project.id)
+            .options(*_project_list_options())
             .filter(
                 and_(
                     Project.organization_id == organization_id,
@@ -211,18 +235,19 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         """Search reports by name, description, or report type."""
         from app.db.models.project import Project
         
-        search_term = f"%{query.lower()}%"
+        search_term = contains_pattern(query)
         
         return (
             db.query(self.model)
             .join(Project, self.model.project_id == Project.id)
+            .options(*_project_list_options())
             .filter(
                 and_(
                     Project.organization_id == organization_id,
                     or_(
-                        func.lower(self.model.title).contains(search_term),
-                        func.lower(self.model.description).contains(search_term),
-                        func.lower(self.model.report_type).contains(search_term)
+                        self.model.title.ilike(search_term, escape=LIKE_ESCAPE),
+                        self.model.description.ilike(search_term, escape=LIKE_ESCAPE),
+                        cast(self.model.report_type, String).ilike(search_term, escape=LIKE_ESCAPE)
                     )
                 )
             )
@@ -238,52 +263,44 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         """Get report statistics for organization."""
         from app.db.models.project import Project
         
-        base_query = (
-            db.query(self.model)
-            .join(Project, self.model.project_id == Project.id)
-            .filter(Project.organization_id == organization_id)
-        )
-
-        total_reports = base_query.count()
-        
-        completed_reports = base_query.filter(
-            self.model.status == "completed"
-        ).count()
-        
-        failed_reports = base_query.filter(
-            self.model.status == "failed"
-        ).count()
+        is_completed = self.model.status == "completed"
         
-        generating_reports = base_query.filter(
-            self.model.status == "generating"
-        ).count()
-
-        # Calculate by type
-        type_stats = (
-            base_query
-            .with_entities(
+        # A single pass over the organization's reports: one row per
+        # (type, format) pair carrying every count the summary needs
+        rows = (
+            db.query(
                 self.model.report_type,
-                func.count(self.model.id).label('count')
+                self.model.report_format,
+                func.count(self.model.id),
+                func.count(self.model.id).filter(is_completed),
+                func.count(self.model.id).filter(self.model.status == "failed"),
+                func.count(self.model.id).filter(self.model.status == "generating"),
+                func.sum(self.model.file_size_bytes).filter(is_completed)
             )
-            .group_by(self.model.report_type)
+            .join(Project, self.model.project_id == Project.id)
+            .filter(Project.organization_id == organization_id)
+            .group_by(self.model.report_type, self.model.report_format)
             .all()
         )
         
-        reports_by_type = {stat[0]: stat[1] for stat in type_stats}
+        total_reports = sum(row[2] for row in rows)
+        completed_reports = sum(row[3] for row in rows)
+        failed_reports = sum(row[4] for row in rows)
+        generating_reports = sum(row[5] for row in rows)
+        total_size = sum(row[6] or 0 for row in rows)
         
-        # Calculate by format
-        format_stats = (
-            base_query
-            .filter(self.model.status == "completed")
-            .with_entities(
-                self.model.report_format,
-                func.count(self.model.id).label('count')
-            )
-            .group_by(self.model.report_format)
-            .all()
-        )
+        # Calculate by type
+        reports_by_type: Dict[Any, int] = {}
+        for report_type, _, count, _, _, _, _ in rows:
+            reports_by_type[report_type] = reports_by_type.get(report_type, 0) + count
         
-        reports_by_format = {stat[0]: stat[1] for stat in format_stats}
+        # Calculate by format, completed reports only
+        reports_by_format: Dict[Any, int] = {}
+        for _, report_format, _, completed, _, _, _ in rows:
+            if completed:
+                reports_by_format[report_format] = (
+                    reports_by_format.get(report_format, 0) + completed
+                )
         
         # Calculate success rate
         success_rate = (
@@ -291,19 +308,6 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
             if total_reports > 0 else 0
         )
 
-        # Calculate total file size
-        total_size = (
-            base_query
-            .filter(
-                and_(
-                    self.model.status == "completed",
-                    self.model.file_size_bytes.isnot(None)
-                )
-            )
-            .with_entities(func.sum(self.model.file_size_bytes))
-            .scalar() or 0
-        )
-
         return {
             "total_reports": total_reports,
             "completed_reports": completed_reports,
@@ -326,35 +330,36 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         error_message: Optional[str] = None
     ) -> Optional[Report]:
         """Update report status and file information."""
-        report = self.get(db, id=report_id)
-        if report:
-            update_data = {
-                "status": status,
-                "generated_at": datetime.utcnow() if status == "completed" else None,
-                "error_message": error_message
-            }
-            
-            if file_path:
-                update_data["file_path"] = file_path
-            if file_size:
-                update_data["file_size_bytes"] = file_size
-                
-            return self.update(db, db_obj=report, obj_in=update_data)
-        return None
+        update_data = {
+            "status": status,
+            "generated_at": func.now() if status == "completed" else None,
+            "error_message": error_message
+        }
+        
+        if file_path:
+            update_data["file_path"] = file_path
+        if file_size:
+            update_data["file_size_bytes"] = file_size
+        
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        report = self.update_returning(db, id=report_id, values=update_data)
+        if report is None:
+            db.rollback()
+        return report
 
     def get_report_count_by_vessel(
         self, db: Session, *, vessel_id: int
     ) -> int:
         """Get count of reports for a vessel."""
         return (
-            db.query(self.model)
+            db.query(func.count(self.model.id))
             .filter(
                 and_(
                     self.model.vessel_id == vessel_id,
                     self.model.is_active == True
                 )
             )
-            .count()
+            .scalar()
         )
 
     def get_report_count_by_organization(
@@ -364,10 +369,10 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         from app.db.models.project import Project
         
         return (
-            db.query(self.model)
+            db.query(func.count(self.model.id))
             .join(Project, self.model.project_id == Project.id)
             .filter(Project.organization_id == organization_id)
-            .count()
+            .scalar()
         )
 
     def get_by_organization(
@@ -379,6 +384,7 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         return (
             db.query(self.model)
             .join(Project, self.model.project_id == Project.id)
+            .options(*_project_list_options())
             .filter(Project.organization_id == organization_id)
             .order_by(self.model.created_at.desc())
             .offset(skip)
@@ -400,6 +406,7 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         return (
             db.query(self.model)
             .join(Project, self.model.project_id == Project.id)
+            .options(*_project_list_options())
             .filter(
                 and_(
                     Project.organization_id == organization_id,
@@ -422,7 +429,9 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
         """Mark old reports as inactive for cleanup."""
         cutoff_date = datetime.utcnow() - timedelta(days=days_old)
         
-        old_reports = (
+        # One bulk UPDATE instead of loading and soft-deleting each report;
+        # updated_at is bumped by its onupdate default
+        count = (
             db.query(self.model)
             .filter(
                 and_(
@@ -430,14 +439,10 @@ class CRUDReport(CRUDBase[Report, ReportCreate, ReportUpdate]):
                     self.model.is_active == True
                 )
             )
-            .all()
+            .update({self.model.is_active: False}, synchronize_session=False)
         )
+        db.commit()
         
-        count = 0
-        for report in old_reports:
-            self.soft_delete(db, id=report.id)
-            count += 1
-            
         return count
 
 
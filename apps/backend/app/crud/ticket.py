@@ -1,5 +1,6 @@
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.db.models.ticket import Ticket
 from app.schemas.ticket import TicketCreate, TicketUpdate
 
@@ -13,16 +14,25 @@ class TicketCRUD:
         return db.query(Ticket).offset(skip).limit(limit).all()
 
     def get_multi_filtered(self, db: Session, filters: list, skip: int = 0, limit: int = 100):
-        query = db.query(Ticket)
-        for f in filters:
-            query = query.filter(f)
-        return query.offset(skip).limit(limit).all()
+        return db.query(Ticket).filter(*filters).offset(skip).limit(limit).all()
 
     def count_filtered(self, db: Session, filters: list) -> int:
-        query = db.query(Ticket)
-        for f in filters:
-            query = query.filter(f)
-        return query.count()
+        # Plain COUNT rather than Query.count()'s SELECT COUNT(*) FROM (subquery)
+        return db.query(func.count(Ticket.id)).filter(*filters).scalar()
+
+    def paginate(self, db: Session, filters: list, skip: int = 0, limit: int = 100) -> Tuple[List[Ticket], int]:
+        # COUNT(*) OVER () returns the filtered total alongside the page
+        rows = (
+            db.query(Ticket, func.count().over().label('total'))
+            .filter(*filters)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        # Empty page (or skip past the end): the total still needs counting
+        return [], self.count_filtered(db, filters)
 
     def create(self, db: Session, obj_in: TicketCreate, user_id: int, organization_id: int) -> Ticket:
         db_obj = Ticket(**obj_in.dict(), user_id=user_id, organization_id=organization_id)
@@ -31,12 +41,31 @@ class TicketCRUD:
         db.refresh(db_obj)
         return db_obj
 
+    def create_many(self, db: Session, objs_in: List[TicketCreate], user_id: int, organization_id: int) -> List[int]:
+        rows = [
+            {**obj_in.model_dump(), 'user_id': user_id, 'organization_id': organization_id}
+            for obj_in in objs_in
+        ]
+        if not rows:
+            return []
+        # One batched INSERT ... RETURNING for all rows, committed once
+        result = db.execute(insert(Ticket).returning(Ticket.id, sort_by_parameter_order=True), rows)
+        ids = list(result.scalars().all())
+        db.commit()
+        return ids
+
     def update(self, db: Session, db_obj: Ticket, obj_in: TicketUpdate) -> Ticket:
-        for field, value in obj_in.dict(exclude_unset=True).items():
-            setattr(db_obj, field, value)
+        data = obj_in.model_dump(exclude_unset=True)
+        if not data:
+            return db_obj
+        # Single UPDATE ... RETURNING instead of attribute writes plus refresh
+        stmt = update(Ticket).where(Ticket.id == db_obj.id).values(**data).returning(Ticket)
+        # populate_existing refreshes db_obj itself, which is already loaded
+        ticket = db.execute(
+            select(Ticket).from_statement(stmt).execution_options(populate_existing=True)
+        ).scalar_one()
         db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return ticket
 
     def delete(self, db: Session, id: int) -> None:
         obj = db.query(Ticket).filter(Ticket.id == id).first()
@@ -6,19 +6,230 @@ authentication, profile updates, and user administration.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Sequence
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, bindparam, case, event, func, insert, inspect, lambda_stmt, or_, select, update
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import BCRYPT_POOL, get_password_hash, run_in_bcrypt_pool, verify_password
+from app.core.time import as_utc, utcnow
 from app.crud.base import CRUDBase
 from app.db.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.cache_service import cache_service
+from app.utils.validation import LIKE_ESCAPE, contains_pattern
+
+
+# Failed attempts that lock an account, and for how long
+MAX_FAILED_LOGIN_ATTEMPTS = 5
+ACCOUNT_LOCKOUT_DURATION = timedelta(minutes=15)
+
+# Columns cached for per-request authentication; never credentials
+_AUTH_CACHE_FIELDS = (
+    "email", "role", "is_active", "is_superuser", "is_verified", "organization_id"
+)
+_AUTH_CACHE_TTL = 60
+
+# Login and registration look users up by email on every call; a lambda
+# statement is built once and reused from the statement cache
+_USER_BY_EMAIL = lambda_stmt(
+    lambda: select(User).where(User.email == bindparam("email")).limit(1)
+)
+
+
+def _auth_cache_key(user_id: int) -> str:
+    """Cache key for a user's authentication projection."""
+    return f"vessel_guard:user:{user_id}:auth"
+
+
+# Session.info key for users whose cached auth data the open transaction
+# has made stale
+_PENDING_AUTH_INVALIDATIONS = "vessel_guard_auth_invalidations"
+
+
+def invalidate_auth_cache_on_commit(db: Session, user_id: int) -> None:
+    """
+    Drop a user's cached authentication data when the session commits.
+    
+    Deleting inside the transaction would let a concurrent get_for_auth
+    re-cache the old row until the TTL expires, so the delete waits for
+    the commit. Changes flushed through the ORM are queued automatically;
+    UPDATE statements that bypass it must call this for each user.
+    
+    Args:
+        db: Database session holding the uncommitted change
+        user_id: User ID
+    """
+    db.info.setdefault(_PENDING_AUTH_INVALIDATIONS, set()).add(user_id)
+
+
+def _queue_flushed_auth_invalidations(session: Session, flush_context: Any) -> None:
+    """Queue invalidation for flushed users whose cached columns changed."""
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            invalidate_auth_cache_on_commit(session, obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, User):
+            attrs = inspect(obj).attrs
+            if any(attrs[field].history.has_changes() for field in _AUTH_CACHE_FIELDS):
+                invalidate_auth_cache_on_commit(session, obj.id)
+
+
+def _apply_auth_invalidations(session: Session) -> None:
+    """Drop cached auth data for users changed by the committed transaction."""
+    for user_id in session.info.pop(_PENDING_AUTH_INVALIDATIONS, ()):
+        cache_service.delete(_auth_cache_key(user_id))
+
+
+def _discard_auth_invalidations(session: Session) -> None:
+    """Forget pending invalidations; a rollback left the cached rows valid."""
+    session.info.pop(_PENDING_AUTH_INVALIDATIONS, None)
+
+
+event.listen(Session, "after_flush", _queue_flushed_auth_invalidations)
+event.listen(Session, "after_commit", _apply_auth_invalidations)
+event.listen(Session, "after_rollback", _discard_auth_invalidations)
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash verified against when no user matches, computed once on first use."""
+    return get_password_hash("vessel-guard-timing-equalizer")
+
+
+def _password_hash_to_check(user: Optional[User]) -> str:
+    """
+    Hash to verify a login password against.
+    
+    Unknown emails are checked against a dummy hash, spending the same
+    bcrypt time as a real check so response timing does not reveal
+    whether the email is registered.
+    
+    Args:
+        user: User looked up by email, if any
+        
+    Returns:
+        Stored or dummy password hash
+    """
+    return user.hashed_password if user is not None else _dummy_password_hash()
+
+
+def _db_now(db: Session, offset: Optional[timedelta] = None) -> Any:
+    """
+    Current time as evaluated by the database, optionally shifted.
+    
+    Args:
+        db: Database session
+        offset: Interval to add to the current time
+        
+    Returns:
+        SQL expression for the timestamp
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite has no interval type; datetime() takes the shift as a modifier
+        modifiers = [f"{offset.total_seconds():+} seconds"] if offset else []
+        return func.datetime("now", *modifiers)
+    
+    now = func.now()
+    return now + offset if offset else now
+
+
+def _new_user_values(obj_in: UserCreate, hashed_password: str) -> Dict[str, Any]:
+    """Column values for a newly registered user."""
+    return {
+        "email": obj_in.email,
+        "hashed_password": hashed_password,
+        "first_name": obj_in.first_name,
+        "last_name": obj_in.last_name,
+        "phone": obj_in.phone,
+        "job_title": obj_in.job_title,
+        "department": obj_in.department,
+        "role": obj_in.role,
+        "timezone": obj_in.timezone,
+        "language": obj_in.language,
+        "organization_id": obj_in.organization_id,
+        "is_active": True,
+        "is_verified": False  # Require email verification
+    }
+
+
+def _user_pk(user: User) -> int:
+    """Primary key of a persistent user, read without reloading expired state."""
+    return inspect(user).identity[0]
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """CRUD operations for User model."""
 
+    def _update_columns(
+        self, db: Session, *, user: User, values: Dict[str, Any], commit: bool = True
+    ) -> User:
+        """
+        Write column values for one user with a single UPDATE ... RETURNING.
+        
+        Values may be SQL expressions. The stored values, including the
+        server-set updated_at, are returned by the UPDATE and applied to
+        the instance as committed state, so no refresh SELECT is needed.
+        
+        Args:
+            db: Database session
+            user: User to update
+            values: Column name to value or SQL expression mapping
+            commit: Commit the transaction; False leaves it open for more writes
+            
+        Returns:
+            Updated user
+        """
+        fields = [*values, "updated_at"]
+        stmt = (
+            update(User)
+            .where(User.id == _user_pk(user))
+            .values(values)
+            .returning(*(getattr(User, field) for field in fields))
+            .execution_options(synchronize_session=False)
+        )
+        row = db.execute(stmt).one()
+        invalidate_auth_cache_on_commit(db, _user_pk(user))
+        if commit:
+            db.commit()
+        
+        for field, value in zip(fields, row):
+            set_committed_value(user, field, value)
+        return user
+
+    def get_for_auth(self, db: Session, *, user_id: int) -> Optional[User]:
+        """
+        Get user for request authentication, served from cache when possible.
+        
+        On a cache hit the user is attached to the session from the cached
+        columns without a SELECT; any other attribute loads on first access.
+        
+        Args:
+            db: Database session
+            user_id: User ID from the access token
+            
+        Returns:
+            User if found, None otherwise
+        """
+        cache_key = _auth_cache_key(user_id)
+        cached = cache_service.get(cache_key)
+        if cached is not None and db.identity_map.get(identity_key(User, user_id)) is None:
+            user = User(id=user_id, **cached)
+            make_transient_to_detached(user)
+            db.add(user)
+            return user
+        
+        user = db.get(User, user_id)
+        if user is not None:
+            cache_service.set(
+                cache_key,
+                {field: getattr(user, field) for field in _AUTH_CACHE_FIELDS},
+                ttl=_AUTH_CACHE_TTL
+            )
+        return user
+
     def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
         """
         Get user by email address.
@@ -30,42 +241,71 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             User if found, None otherwise
         """
-        return db.query(User).filter(User.email == email).first()
+        return db.execute(_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
+    def create(
+        self, db: Session, *, obj_in: UserCreate, hashed_password: Optional[str] = None
+    ) -> User:
         """
         Create new user.
         
         Args:
             db: Database session
             obj_in: User creation data
+            hashed_password: Password hash computed by the caller, e.g. on
+                the bcrypt pool; hashed here when omitted
             
         Returns:
             Created user
         """
-        hashed_password = get_password_hash(obj_in.password)
-        
-        db_obj = User(
-            email=obj_in.email,
-            hashed_password=hashed_password,
-            first_name=obj_in.first_name,
-            last_name=obj_in.last_name,
-            phone=obj_in.phone,
-            job_title=obj_in.job_title,
-            department=obj_in.department,
-            role=obj_in.role,
-            timezone=obj_in.timezone,
-            language=obj_in.language,
-            organization_id=obj_in.organization_id,
-            is_active=True,
-            is_verified=False  # Require email verification
-        )
+        if hashed_password is None:
+            hashed_password = get_password_hash(obj_in.password)
+        
+        db_obj = User(**_new_user_values(obj_in, hashed_password))
         
+        # Server defaults return with the INSERT (eager_defaults) and the
+        # session does not expire on commit, so no refresh is needed
         db.add(db_obj)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
+    def bulk_create(self, db: Session, *, objs_in: Sequence[UserCreate]) -> List[int]:
+        """
+        Create many users with a single batched INSERT.
+        
+        Used for seeding and organization imports, where creating users
+        one by one costs an INSERT, commit and refresh per user.
+        
+        Args:
+            db: Database session
+            objs_in: User creation data
+            
+        Returns:
+            IDs of the created users, in input order
+        """
+        if not objs_in:
+            return []
+        
+        # bcrypt releases the GIL, so the hashes are computed in parallel
+        hashed_passwords = BCRYPT_POOL.map(
+            get_password_hash, [obj_in.password for obj_in in objs_in]
+        )
+        rows = [
+            _new_user_values(obj_in, hashed_password)
+            for obj_in, hashed_password in zip(objs_in, hashed_passwords)
+        ]
+        
+        # An executemany INSERT ... RETURNING is sent as multi-row VALUES
+        # batches, keeping the row order of the parameters
+        user_ids = list(
+            db.scalars(
+                insert(User).returning(User.id, sort_by_parameter_order=True),
+                rows
+            )
+        )
+        db.commit()
+        return user_ids
+
     def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
         """
         Authenticate user with email and password.
@@ -79,23 +319,70 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             User if authenticated, None otherwise
         """
         user = self.get_by_email(db, email=email)
-        if not user:
+        if user is not None and self.is_locked(user):
+            # Locked accounts are refused before password verification
             return None
         
-        # Check if account is locked before attempting password verification
-        if self.is_locked(user):
+        verified = verify_password(password, _password_hash_to_check(user))
+        return self._finish_authentication(db, user=user, verified=verified)
+
+    async def authenticate_async(
+        self, db: Session, *, email: str, password: str
+    ) -> Optional[User]:
+        """
+        Authenticate like authenticate, verifying the password on the bcrypt pool.
+        
+        Only the bcrypt check leaves the calling thread; the session work
+        stays on it, so slow queries never hold a bcrypt worker.
+        
+        Args:
+            db: Database session
+            email: User email
+            password: User password
+            
+        Returns:
+            User if authenticated, None otherwise
+        """
+        user = self.get_by_email(db, email=email)
+        if user is not None and self.is_locked(user):
+            return None
+        
+        verified = await run_in_bcrypt_pool(
+            verify_password, password, _password_hash_to_check(user)
+        )
+        return self._finish_authentication(db, user=user, verified=verified)
+
+    def _finish_authentication(
+        self, db: Session, *, user: Optional[User], verified: bool
+    ) -> Optional[User]:
+        """
+        Record the outcome of a password check.
+        
+        Args:
+            db: Database session
+            user: User looked up by email, if any
+            verified: Whether the password matched
+            
+        Returns:
+            User if authenticated, None otherwise
+        """
+        if user is None:
             return None
         
-        if not verify_password(password, user.hashed_password):
+        if not verified:
             # Increment failed login attempts
             self.increment_failed_login_attempts(db, user=user)
             return None
         
-        # Reset failed login attempts on successful login
-        self.reset_failed_login_attempts(db, user=user)
+        # Reset failed login attempts on successful login; most logins have
+        # nothing to reset, so skip the write entirely
+        if user.failed_login_attempts or user.locked_until is not None:
+            self.reset_failed_login_attempts(db, user=user)
         return user
 
-    def update_password(self, db: Session, *, user: User, hashed_password: str) -> User:
+    def update_password(
+        self, db: Session, *, user: User, hashed_password: str, commit: bool = True
+    ) -> User:
         """
         Update user password.
         
@@ -103,75 +390,93 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             db: Database session
             user: User to update
             hashed_password: New hashed password
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.hashed_password = hashed_password
-        user.updated_at = datetime.utcnow()
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return self._update_columns(
+            db, user=user, values={"hashed_password": hashed_password}, commit=commit
+        )
 
-    def update_last_login(self, db: Session, *, user: User) -> User:
+    def update_last_login(self, db: Session, *, user: User, commit: bool = True) -> User:
         """
         Update user's last login timestamp.
         
         Args:
             db: Database session
             user: User to update
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.last_login = datetime.utcnow()
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return self._update_columns(
+            db, user=user, values={"last_login": _db_now(db)}, commit=commit
+        )
 
-    def increment_failed_login_attempts(self, db: Session, *, user: User) -> User:
+    def increment_failed_login_attempts(
+        self, db: Session, *, user: User, commit: bool = True
+    ) -> User:
         """
         Increment failed login attempts counter.
         
         Args:
             db: Database session
             user: User to update
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.failed_login_attempts += 1
-        
-        # Lock account after 5 failed attempts for 15 minutes
-        if user.failed_login_attempts >= 5:
-            user.locked_until = datetime.utcnow() + timedelta(minutes=15)
+        attempts = User.failed_login_attempts + 1
+        
+        # Increment in SQL so concurrent failures are all counted, and lock
+        # the account once the attempts reach the limit
+        stmt = (
+            update(User)
+            .where(User.id == _user_pk(user))
+            .values(
+                failed_login_attempts=attempts,
+                locked_until=case(
+                    (
+                        attempts >= MAX_FAILED_LOGIN_ATTEMPTS,
+                        _db_now(db, ACCOUNT_LOCKOUT_DURATION)
+                    ),
+                    else_=User.locked_until
+                )
+            )
+            .returning(User.failed_login_attempts, User.locked_until)
+            .execution_options(synchronize_session=False)
+        )
+        failed_login_attempts, locked_until = db.execute(stmt).one()
+        if commit:
+            db.commit()
         
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+        set_committed_value(user, "failed_login_attempts", failed_login_attempts)
+        set_committed_value(user, "locked_until", locked_until)
         return user
 
-    def reset_failed_login_attempts(self, db: Session, *, user: User) -> User:
+    def reset_failed_login_attempts(self, db: Session, *, user: User, commit: bool = True) -> User:
         """
         Reset failed login attempts counter.
         
         Args:
             db: Database session
             user: User to update
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.failed_login_attempts = 0
-        user.locked_until = None
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return self._update_columns(db, user=user, values={
+            "failed_login_attempts": 0,
+            "locked_until": None
+        }, commit=commit)
 
-    def set_password_reset_token(self, db: Session, *, user: User, token: str) -> User:
+    def set_password_reset_token(
+        self, db: Session, *, user: User, token: str, commit: bool = True
+    ) -> User:
         """
         Set password reset token.
         
@@ -179,87 +484,78 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             db: Database session
             user: User to update
             token: Reset token
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.password_reset_token = token
-        user.password_reset_expires = datetime.utcnow() + timedelta(hours=24)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return self._update_columns(db, user=user, values={
+            "password_reset_token": token,
+            "password_reset_expires": _db_now(db, timedelta(hours=24))
+        }, commit=commit)
 
-    def clear_password_reset_token(self, db: Session, *, user: User) -> User:
+    def clear_password_reset_token(self, db: Session, *, user: User, commit: bool = True) -> User:
         """
         Clear password reset token.
         
         Args:
             db: Database session
             user: User to update
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.password_reset_token = None
-        user.password_reset_expires = None
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return self._update_columns(db, user=user, values={
+            "password_reset_token": None,
+            "password_reset_expires": None
+        }, commit=commit)
 
-    def verify_email(self, db: Session, *, user: User) -> User:
+    def verify_email(self, db: Session, *, user: User, commit: bool = True) -> User:
         """
         Mark user email as verified.
         
         Args:
             db: Database session
             user: User to update
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.is_verified = True
-        user.email_verification_token = None
-        user.email_verification_expires = None
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return self._update_columns(db, user=user, values={
+            "is_verified": True,
+            "email_verification_token": None,
+            "email_verification_expires": None
+        }, commit=commit)
 
-    def deactivate(self, db: Session, *, user: User) -> User:
+    def deactivate(self, db: Session, *, user: User, commit: bool = True) -> User:
         """
         Deactivate user account.
         
         Args:
             db: Database session
             user: User to deactivate
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.is_active = False
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return self._update_columns(db, user=user, values={"is_active": False}, commit=commit)
 
-    def activate(self, db: Session, *, user: User) -> User:
+    def activate(self, db: Session, *, user: User, commit: bool = True) -> User:
         """
         Activate user account.
         
         Args:
             db: Database session
             user: User to activate
+            commit: Commit the transaction; False leaves it open for more writes
             
         Returns:
             Updated user
         """
-        user.is_active = True
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        return self._update_columns(db, user=user, values={"is_active": True}, commit=commit)
 
     def get_by_organization(
         self, 
@@ -267,7 +563,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         *, 
         organization_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        load: Sequence[str] = ()
     ) -> List[User]:
         """
         Get users by organization.
@@ -277,12 +574,13 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             organization_id: Organization ID
             skip: Number of records to skip
             limit: Maximum number of records to return
+            load: Relationships to eager-load with selectinload
             
         Returns:
             List of users
         """
         return (
-            db.query(User)
+            self._with_relationships(db.query(User), load)
             .filter(User.organization_id == organization_id)
             .offset(skip)
             .limit(limit)
@@ -296,7 +594,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         role: UserRole,
         organization_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        load: Sequence[str] = ()
     ) -> List[User]:
         """
         Get users by role.
@@ -307,11 +606,12 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             organization_id: Optional organization filter
             skip: Number of records to skip
             limit: Maximum number of records to return
+            load: Relationships to eager-load with selectinload
             
         Returns:
             List of users
         """
-        query = db.query(User).filter(User.role == role)
+        query = self._with_relationships(db.query(User), load).filter(User.role == role)
         
         if organization_id:
             query = query.filter(User.organization_id == organization_id)
@@ -340,10 +640,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             List of matching users
         """
+        search_term = contains_pattern(query)
         search_filter = or_(
-            User.first_name.ilike(f"%{query}%"),
-            User.last_name.ilike(f"%{query}%"),
-            User.email.ilike(f"%{query}%")
+            User.first_name.ilike(search_term, escape=LIKE_ESCAPE),
+            User.last_name.ilike(search_term, escape=LIKE_ESCAPE),
+            User.email.ilike(search_term, escape=LIKE_ESCAPE)
         )
         
         db_query = db.query(User).filter(search_filter)
@@ -364,7 +665,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             Number of users
         """
-        return db.query(User).filter(User.organization_id == organization_id).count()
+        return db.query(func.count(User.id)).filter(User.organization_id == organization_id).scalar()
 
     def is_superuser(self, user: User) -> bool:
         """
@@ -378,24 +679,26 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         """
         return user.is_superuser
 
-    def is_active(self, user: User) -> bool:
+    def is_active(self, user: User, now: Optional[datetime] = None) -> bool:
         """
         Check if user is active.
         
         Args:
             user: User to check
+            now: Current UTC time, when the caller already read the clock
             
         Returns:
             True if active
         """
-        return user.is_active and not self.is_locked(user)
+        return user.is_active and not self.is_locked(user, now=now)
 
-    def is_locked(self, user: User) -> bool:
+    def is_locked(self, user: User, now: Optional[datetime] = None) -> bool:
         """
         Check if user account is locked.
         
         Args:
             user: User to check
+            now: Current UTC time, when the caller already read the clock
             
         Returns:
             True if locked
@@ -403,7 +706,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         if not user.locked_until:
             return False
         
-        return datetime.utcnow() < user.locked_until
+        return (now or utcnow()) < as_utc(user.locked_until)
 
 
 # Create global instance
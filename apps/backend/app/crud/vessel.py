@@ -5,16 +5,121 @@ Handles pressure vessel management including design parameters,
 inspection tracking, and engineering calculations.
 """
 
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Iterable, List, Optional, Sequence
+from datetime import datetime, timedelta
 
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, exists, func, or_
+from sqlalchemy.orm import InstrumentedAttribute, Query, Session, load_only
 
+from app.core.time import utcnow
 from app.crud.base import CRUDBase
-from app.db.models.vessel import Vessel
+from app.db.models.vessel import DesignCode, Vessel, VesselType
 from app.db.models.project import Project
 from app.schemas.vessel import VesselCreate, VesselUpdate
+from app.utils.validation import LIKE_ESCAPE, contains_pattern
+
+
+# Rows fetched per round trip when an unbounded list is streamed
+STREAM_BATCH_SIZE = 500
+
+# Columns read by the summary and inspection schedule views
+VESSEL_SUMMARY_COLUMNS = (
+    Vessel.id,
+    Vessel.tag_number,
+    Vessel.name,
+    Vessel.vessel_type,
+    Vessel.service_fluid,
+    Vessel.next_inspection_date,
+    Vessel.is_active,
+)
+VESSEL_SCHEDULE_COLUMNS = (
+    Vessel.id,
+    Vessel.tag_number,
+    Vessel.name,
+    Vessel.last_inspection_date,
+    Vessel.next_inspection_date,
+)
+
+
+def _search_predicate(query: str) -> Any:
+    """
+    Build the clause matching vessels by tag, name, description or service fluid.
+    
+    Args:
+        query: Search query
+        
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    search_term = contains_pattern(query)
+    return or_(
+        Vessel.tag_number.ilike(search_term, escape=LIKE_ESCAPE),
+        Vessel.name.ilike(search_term, escape=LIKE_ESCAPE),
+        Vessel.description.ilike(search_term, escape=LIKE_ESCAPE),
+        Vessel.service_fluid.ilike(search_term, escape=LIKE_ESCAPE)
+    )
+
+
+def _overdue_inspection_predicate(now: datetime) -> Any:
+    """
+    Build the clause matching active vessels past their inspection date.
+    
+    Args:
+        now: Current time
+        
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    return and_(
+        Vessel.next_inspection_date.isnot(None),
+        Vessel.next_inspection_date < now,
+        Vessel.is_active == True
+    )
+
+
+def _due_inspection_predicate(due_date: datetime) -> Any:
+    """
+    Build the clause matching active vessels due for inspection by a date.
+    
+    Args:
+        due_date: Latest inspection date to include
+        
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    return and_(
+        Vessel.next_inspection_date.isnot(None),
+        Vessel.next_inspection_date <= due_date,
+        Vessel.is_active == True
+    )
+
+
+def _critical_predicate(now: datetime) -> Any:
+    """
+    Build the clause matching active vessels that need immediate attention.
+    
+    Vessels are critical if overdue for inspection or flagged by the
+    stored is_critical column (high pressure and temperature, or a
+    critical/toxic/flammable service fluid).
+    
+    Args:
+        now: Current time
+        
+    Returns:
+        SQLAlchemy boolean clause
+    """
+    return and_(
+        or_(
+            # Overdue for inspection
+            and_(
+                Vessel.next_inspection_date.isnot(None),
+                Vessel.next_inspection_date < now
+            ),
+            # Service conditions, computed by the database on write
+            Vessel.is_critical == True
+        ),
+        Vessel.is_active == True
+    )
 
 
 class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
@@ -26,7 +131,14 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
     """
 
     def get_by_project(
-        self, db: Session, *, project_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        project_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None,
+        load: Sequence[str] = ("project",)
     ) -> List[Vessel]:
         """
         Get vessels by project.
@@ -36,12 +148,14 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             project_id: Project ID
             skip: Number of records to skip
             limit: Maximum records to return
+            columns: Optional columns to load; the rest are deferred
+            load: Relationships to eager-load with selectinload
             
         Returns:
             List of vessels in project
         """
         return (
-            db.query(Vessel)
+            self._with_relationships(self._with_columns(db.query(Vessel), columns), load)
             .filter(Vessel.project_id == project_id)
             .offset(skip)
             .limit(limit)
@@ -49,7 +163,14 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         )
 
     def get_by_organization(
-        self, db: Session, *, organization_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        organization_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None,
+        load: Sequence[str] = ("project",)
     ) -> List[Vessel]:
         """
         Get vessels by organization through project relationship.
@@ -59,12 +180,14 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             organization_id: Organization ID
             skip: Number of records to skip
             limit: Maximum records to return
+            columns: Optional columns to load; the rest are deferred
+            load: Relationships to eager-load with selectinload
             
         Returns:
             List of vessels in organization
         """
         return (
-            db.query(Vessel)
+            self._with_relationships(self._with_columns(db.query(Vessel), columns), load)
             .join(Project)
             .filter(Project.organization_id == organization_id)
             .offset(skip)
@@ -98,6 +221,31 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             .first()
         )
 
+    def tag_number_exists(
+        self, db: Session, *, tag_number: str, organization_id: int
+    ) -> bool:
+        """
+        Check whether a tag number is already used within organization.
+        
+        Args:
+            db: Database session
+            tag_number: Vessel tag number
+            organization_id: Organization ID
+            
+        Returns:
+            True if a vessel has the tag number, False otherwise
+        """
+        # EXISTS stops at the first matching index entry and loads no vessel
+        return db.query(
+            exists().where(
+                and_(
+                    Vessel.tag_number == tag_number,
+                    Vessel.project_id == Project.id,
+                    Project.organization_id == organization_id
+                )
+            )
+        ).scalar()
+
     def get_by_vessel_type(
         self,
         db: Session,
@@ -105,7 +253,8 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         vessel_type: str,
         organization_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
     ) -> List[Vessel]:
         """
         Get vessels by type.
@@ -116,17 +265,35 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             organization_id: Optional organization filter
             skip: Number of records to skip
             limit: Maximum records to return
+            columns: Optional columns to load; the rest are deferred
             
         Returns:
             List of vessels with matching type
         """
-        query = db.query(Vessel).filter(Vessel.vessel_type == vessel_type)
+        query = self._with_columns(db.query(Vessel), columns).filter(Vessel.vessel_type == vessel_type)
         
         if organization_id:
             query = query.join(Project).filter(Project.organization_id == organization_id)
         
         return query.offset(skip).limit(limit).all()
 
+    def count_by_vessel_type(
+        self, db: Session, *, vessel_type: str, organization_id: Optional[int] = None
+    ) -> int:
+        """
+        Count vessels by type.
+        
+        Args:
+            db: Database session
+            vessel_type: Vessel type
+            organization_id: Optional organization filter
+            
+        Returns:
+            Number of vessels with matching type
+        """
+        query = db.query(func.count(Vessel.id)).filter(Vessel.vessel_type == vessel_type)
+        return self._scope_to_organization(query, organization_id).scalar()
+
     def get_by_design_code(
         self,
         db: Session,
@@ -134,7 +301,8 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         design_code: str,
         organization_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
     ) -> List[Vessel]:
         """
         Get vessels by design code.
@@ -145,11 +313,12 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             organization_id: Optional organization filter
             skip: Number of records to skip
             limit: Maximum records to return
+            columns: Optional columns to load; the rest are deferred
             
         Returns:
             List of vessels with matching design code
         """
-        query = db.query(Vessel).filter(Vessel.design_code == design_code)
+        query = self._with_columns(db.query(Vessel), columns).filter(Vessel.design_code == design_code)
         
         if organization_id:
             query = query.join(Project).filter(Project.organization_id == organization_id)
@@ -161,8 +330,10 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         db: Session,
         *,
         days_ahead: int = 30,
-        organization_id: Optional[int] = None
-    ) -> List[Vessel]:
+        organization_id: Optional[int] = None,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None,
+        limit: Optional[int] = None
+    ) -> Iterable[Vessel]:
         """
         Get vessels due for inspection.
         
@@ -170,52 +341,84 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             db: Database session
             days_ahead: Number of days to look ahead
             organization_id: Optional organization filter
+            columns: Optional columns to load; the rest are deferred
+            limit: Maximum records to return; None streams every match
             
         Returns:
-            List of vessels due for inspection
+            List of vessels due for inspection, or an iterable streaming them in batches
+            when no limit is given
         """
-        from datetime import timedelta
-        
-        future_date = datetime.utcnow() + timedelta(days=days_ahead)
+        future_date = utcnow() + timedelta(days=days_ahead)
         
-        query = db.query(Vessel).filter(
-            and_(
-                Vessel.next_inspection_date.isnot(None),
-                Vessel.next_inspection_date <= future_date,
-                Vessel.is_active == True
-            )
-        )
+        query = self._with_columns(db.query(Vessel), columns).filter(_due_inspection_predicate(future_date))
+        return self._fetch(self._scope_to_organization(query, organization_id), limit)
+
+    def count_due_for_inspection(
+        self,
+        db: Session,
+        *,
+        days_ahead: int = 30,
+        organization_id: Optional[int] = None
+    ) -> int:
+        """
+        Count vessels due for inspection.
         
-        if organization_id:
-            query = query.join(Project).filter(Project.organization_id == organization_id)
+        Args:
+            db: Database session
+            days_ahead: Number of days to look ahead
+            organization_id: Optional organization filter
+            
+        Returns:
+            Number of vessels due for inspection
+        """
+        future_date = utcnow() + timedelta(days=days_ahead)
         
-        return query.all()
+        query = db.query(func.count(Vessel.id)).filter(_due_inspection_predicate(future_date))
+        return self._scope_to_organization(query, organization_id).scalar()
 
     def get_overdue_for_inspection(
-        self, db: Session, *, organization_id: Optional[int] = None
-    ) -> List[Vessel]:
+        self,
+        db: Session,
+        *,
+        organization_id: Optional[int] = None,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None,
+        limit: Optional[int] = None
+    ) -> Iterable[Vessel]:
         """
         Get vessels overdue for inspection.
         
         Args:
             db: Database session
             organization_id: Optional organization filter
+            columns: Optional columns to load; the rest are deferred
+            limit: Maximum records to return; None streams every match
             
         Returns:
-            List of vessels overdue for inspection
+            List of vessels overdue for inspection, or an iterable streaming them in batches
+            when no limit is given
         """
-        query = db.query(Vessel).filter(
-            and_(
-                Vessel.next_inspection_date.isnot(None),
-                Vessel.next_inspection_date < datetime.utcnow(),
-                Vessel.is_active == True
-            )
+        query = self._with_columns(db.query(Vessel), columns).filter(
+            _overdue_inspection_predicate(utcnow())
         )
+        return self._fetch(self._scope_to_organization(query, organization_id), limit)
+
+    def count_overdue_for_inspection(
+        self, db: Session, *, organization_id: Optional[int] = None
+    ) -> int:
+        """
+        Count vessels overdue for inspection.
         
-        if organization_id:
-            query = query.join(Project).filter(Project.organization_id == organization_id)
-        
-        return query.all()
+        Args:
+            db: Database session
+            organization_id: Optional organization filter
+            
+        Returns:
+            Number of vessels overdue for inspection
+        """
+        query = db.query(func.count(Vessel.id)).filter(
+            _overdue_inspection_predicate(utcnow())
+        )
+        return self._scope_to_organization(query, organization_id).scalar()
 
     def search(
         self,
@@ -224,7 +427,8 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         query: str,
         organization_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
     ) -> List[Vessel]:
         """
         Search vessels by tag number, name, or description.
@@ -235,25 +439,35 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             organization_id: Optional organization filter
             skip: Number of records to skip
             limit: Maximum records to return
+            columns: Optional columns to load; the rest are deferred
             
         Returns:
             List of matching vessels
         """
-        search_term = f"%{query}%"
-        db_query = db.query(Vessel).filter(
-            or_(
-                Vessel.tag_number.ilike(search_term),
-                Vessel.name.ilike(search_term),
-                Vessel.description.ilike(search_term),
-                Vessel.service.ilike(search_term)
-            )
-        )
+        db_query = self._with_columns(db.query(Vessel), columns).filter(_search_predicate(query))
         
         if organization_id:
             db_query = db_query.join(Project).filter(Project.organization_id == organization_id)
         
         return db_query.offset(skip).limit(limit).all()
 
+    def count_search(
+        self, db: Session, *, query: str, organization_id: Optional[int] = None
+    ) -> int:
+        """
+        Count vessels matching a search query.
+        
+        Args:
+            db: Database session
+            query: Search query
+            organization_id: Optional organization filter
+            
+        Returns:
+            Number of matching vessels
+        """
+        db_query = db.query(func.count(Vessel.id)).filter(_search_predicate(query))
+        return self._scope_to_organization(db_query, organization_id).scalar()
+
     def get_by_pressure_range(
         self,
         db: Session,
@@ -262,7 +476,8 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         max_pressure: Optional[float] = None,
         organization_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
     ) -> List[Vessel]:
         """
         Get vessels by operating pressure range.
@@ -274,11 +489,12 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             organization_id: Optional organization filter
             skip: Number of records to skip
             limit: Maximum records to return
+            columns: Optional columns to load; the rest are deferred
             
         Returns:
             List of vessels within pressure range
         """
-        query = db.query(Vessel)
+        query = self._with_columns(db.query(Vessel), columns)
         
         if min_pressure is not None:
             query = query.filter(Vessel.operating_pressure >= min_pressure)
@@ -299,7 +515,8 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         max_temperature: Optional[float] = None,
         organization_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
     ) -> List[Vessel]:
         """
         Get vessels by operating temperature range.
@@ -311,11 +528,12 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             organization_id: Optional organization filter
             skip: Number of records to skip
             limit: Maximum records to return
+            columns: Optional columns to load; the rest are deferred
             
         Returns:
             List of vessels within temperature range
         """
-        query = db.query(Vessel)
+        query = self._with_columns(db.query(Vessel), columns)
         
         if min_temperature is not None:
             query = query.filter(Vessel.operating_temperature >= min_temperature)
@@ -341,15 +559,15 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             
         Returns:
             Updated vessel
+            
+        Raises:
+            ValueError: If vessel not found
         """
-        vessel = self.get_or_404(db, id=vessel_id)
-        
-        vessel.next_inspection_date = next_inspection_date
-        vessel.updated_at = datetime.utcnow()
-        
-        db.add(vessel)
-        db.commit()
-        db.refresh(vessel)
+        vessel = self.update_returning(
+            db, id=vessel_id, values={"next_inspection_date": next_inspection_date}
+        )
+        if not vessel:
+            raise ValueError(f"Record with id {vessel_id} not found")
         return vessel
 
     def get_vessel_count_by_project(
@@ -398,7 +616,8 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         material_id: int,
         organization_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None
     ) -> List[Vessel]:
         """
         Get vessels using specific material.
@@ -409,11 +628,12 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
             organization_id: Optional organization filter
             skip: Number of records to skip
             limit: Maximum records to return
+            columns: Optional columns to load; the rest are deferred
             
         Returns:
             List of vessels using the material
         """
-        query = db.query(Vessel).filter(Vessel.material_id == material_id)
+        query = self._with_columns(db.query(Vessel), columns).filter(Vessel.material_id == material_id)
         
         if organization_id:
             query = query.join(Project).filter(Project.organization_id == organization_id)
@@ -421,48 +641,66 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         return query.offset(skip).limit(limit).all()
 
     def get_critical_vessels(
-        self, db: Session, *, organization_id: Optional[int] = None
-    ) -> List[Vessel]:
+        self,
+        db: Session,
+        *,
+        organization_id: Optional[int] = None,
+        columns: Optional[Sequence[InstrumentedAttribute]] = None,
+        limit: Optional[int] = None
+    ) -> Iterable[Vessel]:
         """
         Get vessels that require immediate attention.
         
         Args:
             db: Database session
             organization_id: Optional organization filter
+            columns: Optional columns to load; the rest are deferred
+            limit: Maximum records to return; None streams every match
             
         Returns:
-            List of critical vessels
+            List of critical vessels, or an iterable streaming them in batches
+            when no limit is given
         """
-        # Vessels are critical if:
-        # 1. Overdue for inspection
-        # 2. High pressure and temperature combination
-        # 3. Marked as critical service
-        
-        query = db.query(Vessel).filter(
-            or_(
-                # Overdue for inspection
-                and_(
-                    Vessel.next_inspection_date.isnot(None),
-                    Vessel.next_inspection_date < datetime.utcnow()
-                ),
-                # High pressure (>1000 psi) and high temperature (>400F)
-                and_(
-                    Vessel.operating_pressure > 1000,
-                    Vessel.operating_temperature > 400
-                ),
-                # Service contains 'critical' or 'toxic' or 'flammable'
-                or_(
-                    Vessel.service.ilike('%critical%'),
-                    Vessel.service.ilike('%toxic%'),
-                    Vessel.service.ilike('%flammable%')
-                )
-            )
-        ).filter(Vessel.is_active == True)
+        query = self._with_columns(db.query(Vessel), columns).filter(_critical_predicate(utcnow()))
+        return self._fetch(self._scope_to_organization(query, organization_id), limit)
+
+    def count_critical_vessels(
+        self, db: Session, *, organization_id: Optional[int] = None
+    ) -> int:
+        """
+        Count vessels that require immediate attention.
         
+        Args:
+            db: Database session
+            organization_id: Optional organization filter
+            
+        Returns:
+            Number of critical vessels
+        """
+        query = db.query(func.count(Vessel.id)).filter(_critical_predicate(utcnow()))
+        return self._scope_to_organization(query, organization_id).scalar()
+
+    def _fetch(self, query: Query, limit: Optional[int]) -> Iterable[Vessel]:
+        """Return up to limit vessels, or stream all of them when limit is None."""
+        if limit is not None:
+            return query.limit(limit).all()
+        return query.yield_per(STREAM_BATCH_SIZE)
+
+    def _with_columns(
+        self, query: Query, columns: Optional[Sequence[InstrumentedAttribute]]
+    ) -> Query:
+        """Load only the given vessel columns when a caller narrows them."""
+        if columns:
+            query = query.options(load_only(*columns))
+        return query
+
+    def _scope_to_organization(self, query: Query, organization_id: Optional[int]) -> Query:
+        """Restrict a vessel query to one organization through its project."""
         if organization_id:
-            query = query.join(Project).filter(Project.organization_id == organization_id)
-        
-        return query.all()
+            query = query.join(Project, Vessel.project_id == Project.id).filter(
+                Project.organization_id == organization_id
+            )
+        return query
 
     def get_vessel_statistics(
         self, db: Session, *, organization_id: int
@@ -477,43 +715,39 @@ class CRUDVessel(CRUDBase[Vessel, VesselCreate, VesselUpdate]):
         Returns:
             Dictionary with vessel statistics
         """
-        total_vessels = self.get_vessel_count_by_organization(
-            db, organization_id=organization_id
+        now = utcnow()
+        due_date = now + timedelta(days=30)
+        
+        # One grouped pass over the organization's vessels: a row per
+        # (type, design code) pair with the same inspection/critical
+        # predicates as the count_* helpers folded in as FILTER aggregates
+        rows = (
+            db.query(
+                Vessel.vessel_type,
+                Vessel.design_code,
+                func.count(Vessel.id),
+                func.count(Vessel.id).filter(_overdue_inspection_predicate(now)),
+                func.count(Vessel.id).filter(_due_inspection_predicate(due_date)),
+                func.count(Vessel.id).filter(_critical_predicate(now))
+            )
+            .join(Project, Vessel.project_id == Project.id)
+            .filter(Project.organization_id == organization_id)
+            .group_by(Vessel.vessel_type, Vessel.design_code)
+            .all()
         )
         
-        # Count by type
-        type_counts = {}
-        for vessel_type in ["pressure_vessel", "storage_tank", "heat_exchanger", "reactor", "column"]:
-            count = (
-                db.query(func.count(Vessel.id))
-                .filter(
-                    and_(
-                        Project.organization_id == organization_id,
-                        Vessel.vessel_type == vessel_type
-                    )
-                )
-                .scalar()
-            )
-            type_counts[vessel_type] = count
-        
-        # Count by design code
-        code_counts = {}
-        for code in ["ASME VIII Div 1", "ASME VIII Div 2", "API 650", "API 620", "PD 5500"]:
-            count = (
-                db.query(func.count(Vessel.id))
-                .filter(
-                    and_(
-                        Project.organization_id == organization_id,
-                        Vessel.design_code == code
-                    )
-                )
-                .scalar()
-            )
-            code_counts[code] = count
+        total_vessels = sum(row[2] for row in rows)
+        
+        # Count by type and design code, zero-filling every enum value
+        type_counts = dict.fromkeys((t.value for t in VesselType), 0)
+        code_counts = dict.fromkeys((c.value for c in DesignCode), 0)
+        for vessel_type, design_code, count, _, _, _ in rows:
+            type_counts[vessel_type.value] += count
+            code_counts[design_code.value] += count
         
-        overdue_count = len(self.get_overdue_for_inspection(db, organization_id=organization_id))
-        due_soon_count = len(self.get_due_for_inspection(db, organization_id=organization_id))
-        critical_count = len(self.get_critical_vessels(db, organization_id=organization_id))
+        overdue_count = sum(row[3] for row in rows)
+        due_soon_count = sum(row[4] for row in rows)
+        critical_count = sum(row[5] for row in rows)
         
         return {
             "total_vessels": total_vessels,
@@ -6,33 +6,70 @@ for the Vessel Guard application.
 """
 
 import logging
-from typing import Generator
+import os
+import time
+from functools import lru_cache
+from typing import AsyncGenerator, Awaitable, Callable, Generator, Optional, Tuple, TypeVar
 
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import MetaData, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
-from app.db.connection import create_database_engine, test_database_connection
+from app.db.connection import (
+    create_async_database_engine,
+    create_database_engine,
+    test_database_connection,
+)
 
 logger = logging.getLogger(__name__)
 
-# SQLAlchemy engine configuration
-if settings.TESTING:
-    # Use SQLite for testing
-    SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
+T = TypeVar("T")
+
+# The primary engine (and connection pool) for this process
+engine = create_database_engine()
+
+# Read-only sessions use a replica when one is configured. Only handlers
+# that tolerate replication lag read from it; anything that reads then
+# writes (existence checks, seeding) stays on the primary.
+if settings.READ_REPLICA_URL and not settings.TESTING:
+    read_engine = create_database_engine(settings.READ_REPLICA_URL)
 else:
-    # Use PostgreSQL for production/development with SSL support
-    engine = create_database_engine()
+    read_engine = engine
+
+
+def _dispose_engine_after_fork() -> None:
+    """Drop pooled connections inherited from the parent process."""
+    # close=False leaves the parent's sockets alone; the child just starts
+    # with an empty pool instead of sharing connections with its siblings
+    engine.dispose(close=False)
+    if read_engine is not engine:
+        read_engine.dispose(close=False)
+
+
+# Pre-fork servers (gunicorn, uvicorn --workers) import the app once and fork
+# workers from it, so every worker needs its own connection pool
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_engine_after_fork)
+
+# Session factory. Committed objects keep their loaded state instead of
+# being re-SELECTed on next access; server-generated values are fetched by
+# RETURNING (eager_defaults) or an explicit refresh where they are needed
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine
+)
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Read-only sessions run in autocommit mode: each statement stands alone,
+# so no BEGIN/ROLLBACK round trips wrap the reads
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine.execution_options(isolation_level="AUTOCOMMIT")
+)
 
 # Naming convention for constraints
 convention = {
@@ -48,15 +85,6 @@ metadata = MetaData(naming_convention=convention)
 # Base class for all models
 Base = declarative_base(metadata=metadata)
 
-# Import all models to register them with SQLAlchemy
-# This must come after Base is defined to avoid circular imports
-try:
-    from app.db.models import *  # noqa: F401,F403
-except ImportError as e:
-    logger.warning(f"Could not import all models: {e}")
-    # This is acceptable during initial setup
-
-
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency to get database session.
@@ -75,25 +103,156 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Dependency to get a database session for read-only handlers.
+    
+    Writes made through this session are not transactional, so handlers
+    that modify data must use get_db. Reads go to the read replica when
+    READ_REPLICA_URL is set and may lag the primary slightly.
+    
+    Yields:
+        Read-only database session
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the asyncio engine, creating it on first use.
+    
+    Created lazily so the async driver is only needed once an async
+    handler runs, and always after workers have forked.
+    
+    Returns:
+        SQLAlchemy async engine
+    """
+    return create_async_database_engine()
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker:
+    """
+    Get the AsyncSession factory bound to the async engine.
+    
+    Returns:
+        Async session factory
+    """
+    # Attributes can't be lazily reloaded after commit without an await,
+    # so committed objects keep their loaded state
+    return async_sessionmaker(
+        get_async_engine(),
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an asyncio database session.
+    
+    Handlers using it await their queries instead of holding a worker
+    thread while the database responds. The CRUD layer is synchronous
+    and works with get_db sessions only.
+    
+    Yields:
+        Async database session
+    """
+    async with get_async_sessionmaker()() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {str(e)}", exc_info=True)
+            await db.rollback()
+            raise
+
+
+async def run_db(operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """
+    Run one database operation in its own short-lived async session.
+    
+    For long-lived handlers (WebSockets, server-sent events) that must not
+    hold a pooled connection between operations: the session is committed
+    and closed, returning its connection, as soon as the operation ends.
+    
+    Args:
+        operation: Coroutine function taking the session
+        
+    Returns:
+        The operation's result
+    """
+    async with get_async_sessionmaker()() as db:
+        result = await operation(db)
+        await db.commit()
+        return result
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's pooled connections if it was created."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
 def init_db() -> None:
     """
     Initialize database tables.
     
     Creates all tables defined in models if they don't exist.
     """
+    # Models are registered here rather than when this module is imported,
+    # so importing the session factory does not pull in every model
+    from app.db.models import load_all_models
+    load_all_models()
+    
     try:
-        Base.metadata.create_all(bind=engine)
+        # All DDL in one transaction. One catalog query finds the existing
+        # tables, instead of create_all probing for each table in turn
+        with engine.begin() as conn:
+            existing = set(inspect(conn).get_table_names())
+            missing = [
+                table for table in Base.metadata.sorted_tables
+                if table.name not in existing
+            ]
+            if missing:
+                Base.metadata.create_all(bind=conn, tables=missing, checkfirst=False)
         logger.info("Database tables initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
 
-def test_db_connection() -> bool:
+# How long a connection test result is reused, so frequent health probes
+# do not each check out a pooled connection
+CONNECTION_CHECK_TTL = 5.0
+
+# (monotonic time of the last check, its result)
+_last_connection_check: Optional[Tuple[float, bool]] = None
+
+
+def test_db_connection(force: bool = False) -> bool:
     """
     Test database connection.
     
+    Args:
+        force: Run the test even if a recent result is cached
+        
     Returns:
         True if connection successful, False otherwise
     """
-    return test_database_connection(engine)
+    global _last_connection_check
+    
+    now = time.monotonic()
+    if not force and _last_connection_check is not None:
+        checked_at, result = _last_connection_check
+        if now - checked_at < CONNECTION_CHECK_TTL:
+            return result
+    
+    result = test_database_connection(engine)
+    _last_connection_check = (now, result)
+    return result
@@ -7,37 +7,88 @@ specifically configured for PostgreSQL with SSL support.
 
 import logging
 import os
-from typing import Dict, Any
+import ssl
+from typing import Dict, Any, Optional, Union
+
+import orjson
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# SQLite database used when settings.TESTING is on: in memory, so each
+# test process gets its own clean database and nothing is written to disk.
+# Engines use StaticPool, as an in-memory database lives only as long as
+# its one connection.
+TEST_DATABASE_URL = "sqlite://"
+
+
+def _json_dumps(value: Any) -> str:
+    """
+    Serialize a JSON column value with orjson.
+    
+    Non-string keys are kept as they were with the stdlib encoder, which
+    stringified them; numpy arrays from the calculation engines serialize
+    directly.
+    
+    Args:
+        value: Python value bound to a JSON column
+        
+    Returns:
+        JSON document as text
+    """
+    return orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
 
-def get_database_connection_params() -> Dict[str, Any]:
+# JSON column codec for every engine; the models are JSON heavy and the
+# stdlib encoder/decoder dominated serialization time on those rows
+JSON_CODEC_ARGS: Dict[str, Any] = {
+    "json_serializer": _json_dumps,
+    "json_deserializer": orjson.loads,
+}
+
+
+def get_database_connection_params(url: Optional[str] = None) -> Dict[str, Any]:
     """
     Get optimized database connection parameters for PostgreSQL with SSL support.
     
+    Args:
+        url: Database URL; defaults to settings.DATABASE_URL
+        
     Returns:
         Dictionary of connection parameters
     """
     params = {
-        "pool_pre_ping": True,
-        "pool_recycle": 300,  # Recycle connections every 5 minutes
-        "pool_size": 15,      # Increased pool size for better performance
-        "max_overflow": 30,   # Allow more overflow connections
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,  # Below the server idle timeout
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,  # Burst capacity, closed when returned
         "pool_timeout": 30,   # Timeout for getting connection from pool
+        # LIFO keeps reusing a small hot, TLS-warm set; the rest sit idle
+        # and are recycled instead of all being cycled through
+        "pool_use_lifo": True,
         "echo": settings.DEBUG,
         "echo_pool": settings.DEBUG,  # Echo pool events in debug mode
+        "query_cache_size": 2000,  # Compiled statement cache (default 500)
+        "insertmanyvalues_page_size": 1000,  # Rows per batched INSERT..RETURNING
         
         # Performance optimizations
         "connect_args": {
             "options": "-c default_transaction_isolation=read_committed",
             "application_name": "vessel_guard_api",
             "connect_timeout": 10,
+            # TCP keepalives detect dead peers without SQL probes
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
         }
     }
     
@@ -54,28 +105,47 @@ def get_database_connection_params() -> Dict[str, Any]:
         # Merge with existing connect_args
         params["connect_args"].update(ssl_context)
     
+    # psycopg2 only: batch UPDATE/DELETE executemany with execute_batch too,
+    # one round trip per page instead of per row
+    if make_url(str(url or settings.DATABASE_URL)).get_dialect().driver == "psycopg2":
+        params["executemany_mode"] = "values_plus_batch"
+        params["executemany_batch_page_size"] = 500
+    
     return params
 
 
-def create_database_engine() -> Engine:
+def create_database_engine(url: Optional[str] = None) -> Engine:
     """
     Create database engine with appropriate configuration.
     
+    Uses SQLite when testing and PostgreSQL with SSL support otherwise.
+    
+    Args:
+        url: Database URL; defaults to settings.DATABASE_URL
+        
     Returns:
         SQLAlchemy engine instance
     """
-    connection_params = get_database_connection_params()
+    if settings.TESTING:
+        return create_engine(
+            TEST_DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            **JSON_CODEC_ARGS
+        )
+    
+    connection_params = get_database_connection_params(url)
     
     try:
         engine = create_engine(
-            str(settings.DATABASE_URL),
-            **connection_params
+            str(url or settings.DATABASE_URL),
+            **connection_params,
+            **JSON_CODEC_ARGS
         )
         
-        # Test the connection
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-            
+        # No connection is opened here: the pool connects on first use, so
+        # startup skips a TCP/TLS handshake and no connection exists before
+        # workers fork. Health endpoints run test_database_connection.
         logger.info("Database engine created successfully")
         return engine
         
@@ -87,6 +157,75 @@ def create_database_engine() -> Engine:
         raise
 
 
+def _asyncpg_ssl() -> Union[bool, str, ssl.SSLContext]:
+    """
+    Translate the libpq sslmode setting into asyncpg's ssl argument.
+    
+    Returns:
+        Value for asyncpg's ssl connect argument
+    """
+    mode = settings.POSTGRES_SSL_MODE
+    if not mode or mode == "disable":
+        return False
+    if mode not in ("verify-ca", "verify-full"):
+        return mode
+    
+    cert_path = settings.POSTGRES_SSL_CERT_PATH
+    context = ssl.create_default_context(
+        cafile=cert_path if cert_path and os.path.exists(cert_path) else None
+    )
+    context.check_hostname = mode == "verify-full"
+    return context
+
+
+def create_async_database_engine() -> AsyncEngine:
+    """
+    Create the asyncio database engine for handlers that await queries.
+    
+    The engine uses asyncpg (aiosqlite when testing) against the same
+    database as the sync engine, with its own pool sized from the same
+    settings.
+    
+    Returns:
+        SQLAlchemy async engine instance
+    """
+    if settings.TESTING:
+        return create_async_engine(
+            TEST_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1),
+            poolclass=StaticPool,
+            **JSON_CODEC_ARGS
+        )
+    
+    # asyncpg takes SSL settings as a connect argument, not URL parameters
+    url = make_url(str(settings.DATABASE_URL)).set(
+        drivername="postgresql+asyncpg", query={}
+    )
+    
+    engine = create_async_engine(
+        url,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=30,
+        pool_use_lifo=True,
+        echo=settings.DEBUG,
+        query_cache_size=2000,
+        connect_args={
+            "server_settings": {
+                "application_name": "vessel_guard_api",
+                "default_transaction_isolation": "read committed",
+            },
+            "timeout": 10,
+            "ssl": _asyncpg_ssl(),
+        },
+        **JSON_CODEC_ARGS
+    )
+    
+    logger.info("Async database engine created successfully")
+    return engine
+
+
 def test_database_connection(engine: Engine) -> bool:
     """
     Test database connection and basic functionality.
@@ -99,31 +238,26 @@ def test_database_connection(engine: Engine) -> bool:
     """
     try:
         with engine.connect() as conn:
-            # Test basic connection
-            result = conn.execute(text("SELECT 1 as test"))
-            test_value = result.scalar()
+            # Test basic connection and read database info in one round trip
+            if engine.dialect.name == 'postgresql':
+                row = conn.execute(
+                    text("SELECT 1 as test, current_database(), current_user")
+                ).fetchone()
+            elif engine.dialect.name == 'sqlite':
+                row = conn.execute(text("SELECT 1 as test, sqlite_version()")).fetchone()
+            else:
+                row = conn.execute(text("SELECT 1 as test")).fetchone()
             
-            if test_value != 1:
+            if row is None or row[0] != 1:
                 logger.error("Database connection test failed: unexpected result")
                 return False
-                
-            # Test current database info - handle different database types
-            try:
-                if engine.dialect.name == 'postgresql':
-                    result = conn.execute(text("SELECT current_database(), current_user"))
-                    db_info = result.fetchone()
-                    if db_info:
-                        logger.info(f"Connected to PostgreSQL database: {db_info[0]} as user: {db_info[1]}")
-                elif engine.dialect.name == 'sqlite':
-                    # For SQLite, just check that we can execute a simple query
-                    result = conn.execute(text("SELECT sqlite_version()"))
-                    version = result.scalar()
-                    logger.info(f"Connected to SQLite database, version: {version}")
-                else:
-                    logger.info(f"Connected to {engine.dialect.name} database")
-            except Exception as e:
-                # If database-specific info fails, that's okay as long as basic connection works
-                logger.warning(f"Could not get database info: {e}")
+            
+            if engine.dialect.name == 'postgresql':
+                logger.info(f"Connected to PostgreSQL database: {row[1]} as user: {row[2]}")
+            elif engine.dialect.name == 'sqlite':
+                logger.info(f"Connected to SQLite database, version: {row[1]}")
+            else:
+                logger.info(f"Connected to {engine.dialect.name} database")
             
             return True
             
@@ -147,25 +281,19 @@ def get_database_info(engine: Engine) -> Dict[str, Any]:
     """
     try:
         with engine.connect() as conn:
-            # Get database version and info
-            queries = {
-                "version": "SELECT version()",
-                "current_database": "SELECT current_database()",
-                "current_user": "SELECT current_user",
-                "session_user": "SELECT session_user",
-                "connection_count": "SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()",
-            }
-            
-            info = {}
-            for key, query in queries.items():
-                try:
-                    result = conn.execute(text(query))
-                    info[key] = result.scalar()
-                except SQLAlchemyError as e:
-                    logger.warning(f"Failed to execute query '{key}': {e}")
-                    info[key] = None
-                    
-            return info
+            # Get database version and info in a single round trip
+            query = text("""
+                SELECT
+                    version() AS "version",
+                    current_database() AS "current_database",
+                    current_user AS "current_user",
+                    session_user AS "session_user",
+                    (
+                        SELECT count(*) FROM pg_stat_activity
+                        WHERE datname = current_database()
+                    ) AS "connection_count"
+            """)
+            return dict(conn.execute(query).one()._mapping)
             
     except SQLAlchemyError as e:
         logger.error(f"Failed to get database info: {e}")
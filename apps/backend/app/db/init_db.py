@@ -8,16 +8,23 @@ import asyncio
 import logging
 from typing import Optional
 
+from sqlalchemy import bindparam, exists, func, insert, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core.security import BCRYPT_POOL, get_seed_password_hash
+from app.crud import organization as org_crud
 from app.db.base import SessionLocal, init_db as create_tables
 from app.db.models.user import User, UserRole
 from app.db.models.organization import Organization
 
 logger = logging.getLogger(__name__)
 
+# Seed-time existence check, built once and reused from the statement cache
+_EMAIL_TAKEN = lambda_stmt(
+    lambda: select(exists().where(User.email == bindparam("email")))
+)
+
 
 async def init_db() -> None:
     """
@@ -49,8 +56,8 @@ async def create_initial_data(db: Session) -> None:
         db: Database session
     """
     # Create default organization if none exists
-    org = db.query(Organization).first()
-    if not org:
+    organization_id = org_crud.get_default_id(db)
+    if organization_id is None:
         default_org = Organization(
             name="Default Organization",
             description="Default organization for Vessel Guard",
@@ -58,29 +65,30 @@ async def create_initial_data(db: Session) -> None:
             is_active=True
         )
         db.add(default_org)
-        db.commit()
-        db.refresh(default_org)
+        # Flush for the generated id; both rows commit together below
+        db.flush()
+        organization_id = default_org.id
         logger.info("Created default organization")
-    else:
-        default_org = org
     
     # Create admin user if none exists
-    admin_user = db.query(User).filter(User.email == "admin@vesselguard.com").first()
-    if not admin_user:
+    admin_exists = db.execute(
+        _EMAIL_TAKEN, {"email": "admin@vesselguard.com"}
+    ).scalar()
+    if not admin_exists:
         admin_user = User(
             email="admin@vesselguard.com",
-            hashed_password=get_password_hash("admin123!"),
+            hashed_password=get_seed_password_hash("admin123!"),
             first_name="System",
             last_name="Administrator",
             role=UserRole.ENGINEER,
             is_active=True,
             is_verified=True,
-            organization_id=default_org.id
+            organization_id=organization_id
         )
         db.add(admin_user)
-        db.commit()
-        db.refresh(admin_user)
         logger.info("Created admin user")
+    
+    db.commit()
 
 
 async def seed_initial_data() -> None:
@@ -105,14 +113,14 @@ async def create_sample_data(db: Session) -> None:
         db: Database session
     """
     # Check if sample data already exists
-    user_count = db.query(User).count()
+    user_count = db.query(func.count(User.id)).scalar()
     if user_count > 1:  # More than just the admin user
         logger.info("Sample data already exists, skipping creation")
         return
     
     # Get default organization
-    default_org = db.query(Organization).first()
-    if not default_org:
+    organization_id = org_crud.get_default_id(db)
+    if organization_id is None:
         logger.error("Default organization not found")
         return
     
@@ -134,20 +142,43 @@ async def create_sample_data(db: Session) -> None:
         }
     ]
     
-    for user_data in sample_users:
-        existing_user = db.query(User).filter(User.email == user_data["email"]).first()
-        if not existing_user:
-            user = User(
-                email=user_data["email"],
-                hashed_password=get_password_hash(user_data["password"]),
-                first_name=user_data["first_name"],
-                last_name=user_data["last_name"],
-                role=user_data["role"],
-                is_active=True,
-                is_verified=True,
-                organization_id=default_org.id
+    # One lookup for every sample email instead of one per user
+    existing_emails = set(
+        db.scalars(
+            select(User.email).where(
+                User.email.in_([user_data["email"] for user_data in sample_users])
             )
-            db.add(user)
+        )
+    )
+    
+    new_users = [
+        user_data for user_data in sample_users
+        if user_data["email"] not in existing_emails
+    ]
+    
+    # End the read transaction so no pooled connection is held while the
+    # passwords are hashed in parallel
+    db.commit()
+    hashed_passwords = BCRYPT_POOL.map(
+        get_seed_password_hash, [user_data["password"] for user_data in new_users]
+    )
+    
+    # A single executemany INSERT, sent as one multi-row VALUES statement
+    rows = [
+        {
+            "email": user_data["email"],
+            "hashed_password": hashed_password,
+            "first_name": user_data["first_name"],
+            "last_name": user_data["last_name"],
+            "role": user_data["role"],
+            "is_active": True,
+            "is_verified": True,
+            "organization_id": organization_id
+        }
+        for user_data, hashed_password in zip(new_users, hashed_passwords)
+    ]
+    if rows:
+        db.execute(insert(User), rows)
     
     db.commit()
     logger.info("Sample data created successfully")
@@ -162,7 +193,9 @@ def reset_database() -> None:
         raise RuntimeError("Database reset is only allowed in debug mode")
     
     from app.db.base import Base, engine
+    from app.db.models import load_all_models
     
+    load_all_models()
     logger.warning("Resetting database - all data will be lost!")
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
@@ -170,5 +203,11 @@ def reset_database() -> None:
 
 
 if __name__ == "__main__":
-    # Run initialization if called directly
+    # Run initialization if called directly. uvloop ships with
+    # uvicorn[standard] on Linux/macOS; Windows keeps the default loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(init_db())
@@ -1,21 +1,30 @@
 """
 Database models for the Vessel Guard application.
 
-This module imports all database models to make them available
-for SQLAlchemy metadata creation and Alembic migrations.
+Models are imported on first attribute access (PEP 562), so importing
+one model module does not pull in the package's other models through
+this file. load_all_models registers every model with SQLAlchemy
+metadata, for table creation and Alembic migrations.
 """
 
-from app.db.models.user import User
-from app.db.models.organization import Organization
-from app.db.models.project import Project
-from app.db.models.vessel import Vessel
-from app.db.models.material import Material
-from app.db.models.calculation import Calculation, CalculationResult
-from app.db.models.inspection import Inspection
-from app.db.models.report import Report
-from app.db.models.ticket import Ticket
-from app.core.audit import AuditLog
-from app.core.session_manager import UserSession
+import importlib
+from typing import Any
+
+# Public model name -> defining module
+_MODEL_MODULES = {
+    "User": "app.db.models.user",
+    "Organization": "app.db.models.organization",
+    "Project": "app.db.models.project",
+    "Vessel": "app.db.models.vessel",
+    "Material": "app.db.models.material",
+    "Calculation": "app.db.models.calculation",
+    "CalculationResult": "app.db.models.calculation",
+    "Inspection": "app.db.models.inspection",
+    "Report": "app.db.models.report",
+    "Ticket": "app.db.models.ticket",
+    "AuditLog": "app.services.audit_service",
+    "UserSession": "app.core.session_manager",
+}
 
 __all__ = [
     "User",
@@ -31,3 +40,27 @@ __all__ = [
     "AuditLog",
     "UserSession"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model the first time it is accessed."""
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    model = getattr(importlib.import_module(module_name), name)
+    globals()[name] = model
+    return model
+
+
+def load_all_models() -> None:
+    """
+    Import every model so it is registered with SQLAlchemy.
+    
+    Relationships refer to other models by name, so all of them must be
+    registered before mappers are configured on the first query.
+    """
+    # Import modules rather than resolving names: a model module that is
+    # itself mid-import (and imported app.db.base) is left to finish
+    for module_name in dict.fromkeys(_MODEL_MODULES.values()):
+        importlib.import_module(module_name)
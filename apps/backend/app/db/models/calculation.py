@@ -99,13 +99,15 @@ class Calculation(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
-    # Relationships
+    # Relationships; many-to-ones stay lazy, so list queries that read them
+    # add selectinload() at the query site (see crud.calculation)
     project = relationship("Project", back_populates="calculations")
     vessel = relationship("Vessel", back_populates="calculations")
     calculated_by = relationship("User", back_populates="calculations")
     
-    # Results (one-to-one relationship)
-    result = relationship("CalculationResult", back_populates="calculation", uselist=False, cascade="all, delete-orphan")
+    # Results (one-to-one relationship), batch loaded with one IN query
+    # per result set instead of one SELECT per calculation
+    result = relationship("CalculationResult", back_populates="calculation", uselist=False, cascade="all, delete-orphan", lazy="selectin")
 
     def __repr__(self) -> str:
         return f"<Calculation(id={self.id}, name='{self.name}', type='{self.calculation_type}')>"
@@ -231,22 +233,29 @@ class CalculationResult(Base):
 
     def add_recommendation(self, recommendation: str, priority: str = "medium") -> None:
         """Add engineering recommendation."""
-        if not self.recommendations:
-            self.recommendations = []
-        
-        self.recommendations.append({
+        self.recommendations = [
+            *(self.recommendations or []),
+            self.recommendation_entry(recommendation, priority)
+        ]
+
+    def add_warning(self, warning: str, severity: str = "medium") -> None:
+        """Add warning to results."""
+        self.warnings = [*(self.warnings or []), self.warning_entry(warning, severity)]
+
+    @staticmethod
+    def recommendation_entry(recommendation: str, priority: str = "medium") -> Dict[str, Any]:
+        """Build a recommendations list entry."""
+        return {
             "text": recommendation,
             "priority": priority,
             "timestamp": datetime.utcnow().isoformat()
-        })
+        }
 
-    def add_warning(self, warning: str, severity: str = "medium") -> None:
-        """Add warning to results."""
-        if not self.warnings:
-            self.warnings = []
-        
-        self.warnings.append({
+    @staticmethod
+    def warning_entry(warning: str, severity: str = "medium") -> Dict[str, Any]:
+        """Build a warnings list entry."""
+        return {
             "text": warning,
             "severity": severity,
             "timestamp": datetime.utcnow().isoformat()
-        })
+        }
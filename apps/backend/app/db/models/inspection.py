@@ -9,8 +9,10 @@ import enum
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text, Numeric, JSON
-from sqlalchemy.orm import relationship
+import numpy as np
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text, Numeric, JSON, and_, exists, select, text
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import object_session, relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -79,6 +81,12 @@ class Inspection(Base):
     tracking for pressure vessels and piping systems.
     """
     __tablename__ = "inspections"
+    __table_args__ = (
+        # Per-vessel and dashboard filters on status and schedule
+        Index('idx_inspections_vessel_status', 'vessel_id', 'status'),
+        Index('idx_inspections_vessel_date', 'vessel_id', 'scheduled_date'),
+        Index('idx_inspections_status_date', 'status', 'scheduled_date'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -141,7 +149,8 @@ class Inspection(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
-    # Relationships
+    # Relationships stay lazy; list queries that read them add selectinload()
+    # at the query site
     vessel = relationship("Vessel", back_populates="inspections")
     inspector = relationship("User", back_populates="inspections")
     findings = relationship("InspectionFinding", back_populates="inspection", cascade="all, delete-orphan")
@@ -170,29 +179,60 @@ class Inspection(Base):
         duration = self.actual_completion_date - self.actual_start_date
         return duration.total_seconds() / 3600
 
-    @property
+    @hybrid_property
     def has_critical_findings(self) -> bool:
         """Check if inspection has critical findings."""
+        session = object_session(self)
+        if "findings" not in self.__dict__ and session is not None and self.id is not None:
+            # Ask the database instead of loading every finding for a boolean
+            return session.scalar(
+                select(
+                    exists().where(
+                        and_(
+                            InspectionFinding.inspection_id == self.id,
+                            InspectionFinding.severity == FindingSeverity.CRITICAL
+                        )
+                    )
+                )
+            )
+        
         if not self.findings:
             return False
         
         return any(finding.severity == FindingSeverity.CRITICAL for finding in self.findings)
 
+    @has_critical_findings.inplace.expression
+    @classmethod
+    def _has_critical_findings_expression(cls):
+        """Correlated EXISTS over the inspection's critical findings."""
+        return exists().where(
+            and_(
+                InspectionFinding.inspection_id == cls.id,
+                InspectionFinding.severity == FindingSeverity.CRITICAL
+            )
+        )
+
     def get_minimum_thickness(self) -> float:
         """Get minimum recorded thickness."""
-        if not self.thickness_measurements:
-            return 0.0
-        
-        thicknesses = [m.get("thickness", 0) for m in self.thickness_measurements if "thickness" in m]
-        return min(thicknesses) if thicknesses else 0.0
+        thicknesses = self._thickness_array()
+        return float(thicknesses.min()) if thicknesses.size else 0.0
 
     def get_average_thickness(self) -> float:
         """Get average recorded thickness."""
-        if not self.thickness_measurements:
-            return 0.0
+        thicknesses = self._thickness_array()
+        return float(thicknesses.mean()) if thicknesses.size else 0.0
+
+    def _thickness_array(self) -> np.ndarray:
+        """
+        Get recorded thicknesses as an array, built in a single pass.
         
-        thicknesses = [m.get("thickness", 0) for m in self.thickness_measurements if "thickness" in m]
-        return sum(thicknesses) / len(thicknesses) if thicknesses else 0.0
+        Returns:
+            Thickness values of the measurements that record one
+        """
+        return np.fromiter(
+            (m["thickness"] for m in self.thickness_measurements or () if "thickness" in m),
+            dtype=np.float64,
+        )
 
 
 class InspectionFinding(Base):
@@ -203,6 +243,17 @@ class InspectionFinding(Base):
     defects, measurements, and remedial actions.
     """
     __tablename__ = "inspection_findings"
+    __table_args__ = (
+        # Serves both the findings IN load and the critical-findings EXISTS
+        Index('idx_inspection_findings_inspection_severity', 'inspection_id', 'severity'),
+        # Overdue lookups only ever touch unresolved findings
+        Index(
+            'idx_inspection_findings_open_target',
+            'target_completion_date',
+            postgresql_where=text("status NOT IN ('completed', 'closed')"),
+            sqlite_where=text("status NOT IN ('completed', 'closed')")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
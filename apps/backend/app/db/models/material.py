@@ -6,15 +6,16 @@ and engineering data for design calculations.
 """
 
 import enum
-from typing import TYPE_CHECKING, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, String, Text, Numeric, JSON
+import numpy as np
+from sqlalchemy import Boolean, Column, DateTime, Enum, Integer, String, Text, Numeric, JSON, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
 
-
 class MaterialType(str, enum.Enum):
     """Material type classification."""
     CARBON_STEEL = "carbon_steel"
@@ -119,7 +120,7 @@ class Material(Base):
     def __repr__(self) -> str:
         return f"<Material(id={self.id}, spec='{self.specification}', grade='{self.grade}')>"
 
-    @property
+    @cached_property
     def full_specification(self) -> str:
         """Get full material specification string."""
         return f"{self.specification} {self.grade}"
@@ -134,34 +135,32 @@ class Material(Base):
         Returns:
             Allowable stress at given temperature, or None if not available
         """
-        if not self.allowable_stress_data:
+        table = self._stress_table()
+        if table is None:
             return None
         
-        temperatures = self.allowable_stress_data.get("temperatures", [])
-        stresses = self.allowable_stress_data.get("stresses", [])
+        # np.interp clamps to the end stresses outside the tabulated range
+        # and interpolates linearly in between
+        temperatures, stresses = table
+        return float(np.interp(temperature, temperatures, stresses))
+
+    def _stress_table(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the allowable stress table as arrays.
         
-        if not temperatures or not stresses or len(temperatures) != len(stresses):
+        Returns:
+            (temperatures, stresses) arrays, or None if the data is unusable
+        """
+        data = self.allowable_stress_data
+        if not data:
             return None
         
-        # If temperature is below minimum, use minimum temperature stress
-        if temperature <= temperatures[0]:
-            return stresses[0]
-        
-        # If temperature is above maximum, use maximum temperature stress
-        if temperature >= temperatures[-1]:
-            return stresses[-1]
-        
-        # Linear interpolation for intermediate temperatures
-        for i in range(len(temperatures) - 1):
-            if temperatures[i] <= temperature <= temperatures[i + 1]:
-                # Linear interpolation
-                t1, t2 = temperatures[i], temperatures[i + 1]
-                s1, s2 = stresses[i], stresses[i + 1]
-                
-                stress = s1 + (s2 - s1) * (temperature - t1) / (t2 - t1)
-                return stress
+        temperatures = data.get("temperatures", [])
+        stresses = data.get("stresses", [])
+        if not temperatures or not stresses or len(temperatures) != len(stresses):
+            return None
         
-        return None
+        return np.asarray(temperatures, dtype=float), np.asarray(stresses, dtype=float)
 
     def is_suitable_for_temperature(self, temperature: float) -> bool:
         """
@@ -195,3 +194,14 @@ class Material(Base):
             return False
         
         return design_code in self.applicable_codes
+
+
+def _reset_full_specification(target: Material, *args) -> None:
+    """Drop the cached full_specification when its source columns change."""
+    target.__dict__.pop("full_specification", None)
+
+
+event.listen(Material, "refresh", _reset_full_specification)
+event.listen(Material, "expire", _reset_full_specification)
+event.listen(Material.specification, "set", _reset_full_specification)
+event.listen(Material.grade, "set", _reset_full_specification)
@@ -9,7 +9,7 @@ import enum
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text, JSON
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text, JSON, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -47,6 +47,22 @@ class Project(Base):
     for engineering analysis projects.
     """
     __tablename__ = "projects"
+    __table_args__ = (
+        # Tenant list/count filters on status and due date
+        Index(
+            'idx_projects_org_status_target',
+            'organization_id', 'status', 'target_completion_date',
+            postgresql_include=['id', 'name']
+        ),
+        # Overdue/due-soon lookups only ever touch open projects
+        Index(
+            'idx_projects_org_due_open',
+            'organization_id', 'target_completion_date',
+            postgresql_where=text("status NOT IN ('COMPLETED', 'CANCELLED')")
+        ),
+        # Recent-projects listing: equality on tenant, newest first
+        Index('idx_projects_org_created', 'organization_id', text('created_at DESC')),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -36,6 +36,9 @@ class User(Base):
     organizational relationships.
     """
     __tablename__ = "users"
+    # Fetch server-generated timestamps with RETURNING on flush instead of
+    # a follow-up SELECT when they are next read
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -97,8 +100,11 @@ class User(Base):
     # Session tracking
     sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
     
-    # Audit trail
-    audit_logs = relationship("AuditLog", back_populates="user")
+    # Audit trail; audit_logs.user_id carries no foreign key, so the join
+    # is spelled out and the collection is read-only
+    audit_logs = relationship(
+        "AuditLog", primaryjoin="User.id == foreign(AuditLog.user_id)", viewonly=True
+    )
     tickets = relationship('Ticket', back_populates='user', cascade='all, delete-orphan')
 
     def __repr__(self) -> str:
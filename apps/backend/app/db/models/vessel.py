@@ -9,7 +9,7 @@ import enum
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, Text, Numeric, JSON
+from sqlalchemy import Boolean, Column, Computed, DateTime, Enum, ForeignKey, Index, Integer, String, Text, Numeric, JSON, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -22,6 +22,19 @@ if TYPE_CHECKING:
     from app.db.models.inspection import Inspection
 
 
+# Static part of the critical-vessel rule: high pressure (>1000 psi) and
+# high temperature (>400F), or a critical/toxic/flammable service fluid.
+# Overdue inspections depend on the current time and are checked at query time.
+CRITICAL_CONDITION_SQL = (
+    "COALESCE("
+    "(operating_pressure > 1000 AND operating_temperature > 400)"
+    " OR lower(service_fluid) LIKE '%critical%'"
+    " OR lower(service_fluid) LIKE '%toxic%'"
+    " OR lower(service_fluid) LIKE '%flammable%'"
+    ", false)"
+)
+
+
 class VesselType(str, enum.Enum):
     """Vessel type enumeration."""
     PRESSURE_VESSEL = "pressure_vessel"
@@ -64,6 +77,23 @@ class Vessel(Base):
     and material properties for engineering analysis.
     """
     __tablename__ = "vessels"
+    __table_args__ = (
+        # Vessels reach their organization through project_id, so tenant
+        # lookups lead with it
+        Index('idx_vessels_project_tag', 'project_id', 'tag_number'),
+        Index('idx_vessels_project_next_inspection', 'project_id', 'next_inspection_date'),
+        Index('idx_vessels_project_type', 'project_id', 'vessel_type'),
+        # Only the few critical vessels are indexed
+        Index(
+            'idx_vessels_critical',
+            'project_id',
+            postgresql_where=text('is_critical'),
+            sqlite_where=text('is_critical')
+        ),
+    )
+    # Fetch server-generated values (timestamps, is_critical) with RETURNING
+    # on flush instead of a follow-up SELECT when they are next read
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -118,6 +148,9 @@ class Vessel(Base):
     fluid_viscosity = Column(Numeric(10, 6), nullable=True)
     corrosion_rate = Column(Numeric(10, 4), nullable=True)  # mils per year or mm per year
     
+    # Maintained by the database from the service conditions above
+    is_critical = Column(Boolean, Computed(CRITICAL_CONDITION_SQL, persisted=True), nullable=False)
+    
     # Location and environment
     location = Column(String(255), nullable=True)
     environment = Column(String(100), nullable=True)  # indoor, outdoor, marine, etc.
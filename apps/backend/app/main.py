@@ -19,7 +19,9 @@ from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.logging_config import setup_logging, get_logger
+from app.core.security import configure_password_hashing, run_in_bcrypt_pool
 from app.api.v1.api import api_router
+from app.db.base import dispose_async_engine
 from app.db.init_db import init_db
 from app.middleware.rate_limiting_new import RateLimitMiddleware
 from app.middleware.security import SecurityMiddleware
@@ -38,9 +40,11 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Vessel Guard API...")
     await init_db()
     logger.info("Database initialized successfully")
+    await run_in_bcrypt_pool(configure_password_hashing)
     yield
     # Shutdown
     logger.info("Shutting down Vessel Guard API...")
+    await dispose_async_engine()
 
 
 # Create FastAPI application
@@ -78,6 +82,11 @@ app.add_middleware(EnhancedSecurityMiddleware)
 from app.middleware.audit_middleware import AuditMiddleware
 app.add_middleware(AuditMiddleware)
 
+# N+1 lazy load detection (development only)
+if settings.DEBUG:
+    from app.middleware.lazy_load_detection import LazyLoadDetectionMiddleware
+    app.add_middleware(LazyLoadDetectionMiddleware, raise_on_detect=settings.NPLUSONE_RAISE)
+
 # Error logging middleware (should be early to catch all errors)
 app.add_middleware(ErrorLoggingMiddleware, log_all_requests=settings.DEBUG)
 
@@ -23,7 +23,7 @@ from app.services.audit_service import (
     AuditContext
 )
 from app.db.base import get_db
-from app.core.security import decode_access_token
+from app.core.security import verify_token
 
 logger = get_logger(__name__)
 
@@ -118,7 +118,7 @@ class AuditMiddleware(BaseHTTPMiddleware):
             if auth_header and auth_header.startswith("Bearer "):
                 token = auth_header.split(" ")[1]
                 try:
-                    payload = decode_access_token(token)
+                    payload = verify_token(token)
                     context["user_id"] = payload.get("sub")
                     context["organization_id"] = payload.get("organization_id")
                     context["session_id"] = payload.get("session_id")
@@ -9,7 +9,7 @@ import re
 import json
 import time
 import hashlib
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 from starlette.middleware.base import BaseHTTPMiddleware
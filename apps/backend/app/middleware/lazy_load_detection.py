@@ -0,0 +1,73 @@
+"""
+Lazy load detection middleware for development.
+
+Records every relationship lazy load issued while a request is handled
+and reports relationships that were lazily loaded more than once, which
+is the signature of an N+1 query pattern.
+"""
+
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from app.core.logging_config import get_logger
+
+logger = get_logger('vessel_guard.middleware.lazy_load')
+
+# Lazy loads seen during the current request, keyed by "Model.relationship".
+# Endpoints run in a worker thread with a copy of the request context, so
+# they share this counter with the middleware.
+_lazy_loads: ContextVar[Optional[Counter]] = ContextVar("lazy_loads", default=None)
+
+
+class NPlusOneError(Exception):
+    """Raised when a request lazily loads the same relationship repeatedly."""
+
+
+def _record_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """Count relationship lazy loads for the active request, if any."""
+    counter = _lazy_loads.get()
+    if counter is None or orm_execute_state.lazy_loaded_from is None:
+        return
+
+    path = orm_execute_state.loader_strategy_path
+    relationship = path[-1].key if path else "?"
+    model = orm_execute_state.lazy_loaded_from.class_.__name__
+    counter[f"{model}.{relationship}"] += 1
+
+
+event.listen(Session, "do_orm_execute", _record_lazy_load)
+
+
+class LazyLoadDetectionMiddleware(BaseHTTPMiddleware):
+    """Middleware to flag N+1 lazy loads; only installed when DEBUG is on."""
+
+    def __init__(self, app, raise_on_detect: bool = False):
+        super().__init__(app)
+        self.raise_on_detect = raise_on_detect
+
+    async def dispatch(self, request: Request, call_next):
+        """Track lazy loads while the request is processed."""
+        counter = Counter()
+        token = _lazy_loads.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            _lazy_loads.reset(token)
+
+        repeated = {name: count for name, count in counter.items() if count > 1}
+        if repeated:
+            message = (
+                f"N+1 lazy loads in {request.method} {request.url.path}: "
+                + ", ".join(f"{name} x{count}" for name, count in sorted(repeated.items()))
+            )
+            if self.raise_on_detect:
+                raise NPlusOneError(message)
+            logger.warning(message)
+
+        return response
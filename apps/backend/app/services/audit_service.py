@@ -198,7 +198,7 @@ class AuditService:
             )
             
             # Calculate checksum for integrity
-            audit_entry.checksum = self._calculate_checksum(audit_entry)
+            audit_entry.checksum = self.calculate_checksum(audit_entry)
             
             # Save to database
             db.add(audit_entry)
@@ -441,7 +441,7 @@ class AuditService:
     ) -> bool:
         """Verify the integrity of an audit log entry."""
         try:
-            calculated_checksum = self._calculate_checksum(audit_log)
+            calculated_checksum = self.calculate_checksum(audit_log)
             return calculated_checksum == audit_log.checksum
             
         except Exception as e:
@@ -488,7 +488,7 @@ class AuditService:
         else:
             return "system"
     
-    def _calculate_checksum(self, audit_entry: AuditLog) -> str:
+    def calculate_checksum(self, audit_entry: AuditLog) -> str:
         """Calculate SHA-256 checksum for audit entry integrity."""
         # Create a string representation of the audit entry
         data = {
@@ -67,7 +67,13 @@ celery_app.conf.update(
     task_acks_late=True,
     worker_disable_rate_limits=False,
     task_compression='gzip',
-    result_compression='gzip'
+    result_compression='gzip',
+    beat_schedule={
+        'refresh-project-statistics': {
+            'task': 'app.services.background_tasks.refresh_project_statistics',
+            'schedule': 60.0,  # Every minute
+        },
+    }
 )
 
 
@@ -353,6 +359,23 @@ def cleanup_old_files():
         raise
 
 
+@celery_app.task
+def refresh_project_statistics():
+    """Refresh the precomputed per-organization project statistics."""
+    from app.crud.project import project as project_crud
+    
+    db = SessionLocal()
+    try:
+        project_crud.refresh_statistics_view(db)
+        return {"status": "success"}
+        
+    except Exception as e:
+        logger.error(f"Project statistics refresh failed: {e}")
+        raise
+    finally:
+        db.close()
+
+
 @celery_app.task
 def export_data_task(user_id: str, organization_id: str, export_params: Dict[str, Any]):
     """Export data to various formats (CSV, Excel, PDF)."""
@@ -20,7 +20,7 @@ from sqlalchemy import text
 from app.core.config import settings
 from app.core.logging_config import get_logger
 from app.services.cache_service import cache_service
-from app.db.base import get_db
+from app.db.base import get_read_db
 
 logger = get_logger(__name__)
 
@@ -407,7 +407,7 @@ class HealthChecker:
     def _check_database_health(self) -> Dict[str, Any]:
         """Check database connectivity and performance."""
         try:
-            db = next(get_db())
+            db = next(get_read_db())
             start_time = time.time()
             
             # Test basic query
@@ -658,7 +658,7 @@ alert_manager = AlertManager()
 def collect_all_metrics() -> Dict[str, Any]:
     """Collect all metrics in one operation."""
     try:
-        db = next(get_db())
+        db = next(get_read_db())
         
         system_metrics = metrics_collector.collect_system_metrics()
         app_metrics = metrics_collector.collect_application_metrics(db)
@@ -92,6 +92,24 @@ def sanitize_filename(filename: str) -> str:
     return sanitized or "unnamed_file"
 
 
+# Escape character for LIKE patterns built by contains_pattern
+LIKE_ESCAPE = "\\"
+
+
+def sanitize_like(query: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return (
+        query.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def contains_pattern(query: str) -> str:
+    """Build a '%term%' LIKE pattern from user input; use with escape=LIKE_ESCAPE."""
+    return f"%{sanitize_like(query)}%"
+
+
 def validate_positive_number(value: float, allow_zero: bool = False) -> bool:
     """Validate that a number is positive."""
     if allow_zero:
@@ -120,8 +120,10 @@ def test_model_creation():
     
     try:
         from app.db.base import Base, engine
+        from app.db.models import load_all_models
         
         # Create tables
+        load_all_models()
         Base.metadata.create_all(bind=engine)
         logger.info("✓ Models created successfully")
         
@@ -16,8 +16,9 @@ from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.db.base import Base, get_db
+from app.db.models import load_all_models
 from app.core.config import settings
-from app.db.models.user import User
+from app.db.models.user import User, UserRole
 from app.db.models.organization import Organization, SubscriptionType
 from app.db.models.project import Project
 from app.db.models.vessel import Vessel
@@ -25,8 +26,9 @@ from app.db.models.material import Material
 from app.core.security import get_password_hash
 
 
-# Test database URL - use SQLite for fast tests
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test.db"
+# Test database URL - use in-memory SQLite for fast tests; StaticPool keeps
+# the single connection (and so the database) alive for the whole session
+SQLALCHEMY_TEST_DATABASE_URL = "sqlite://"
 
 # Create test engine
 test_engine = create_engine(
@@ -43,6 +45,7 @@ TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_eng
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_database():
     """Create test database tables."""
+    load_all_models()
     Base.metadata.create_all(bind=test_engine)
     yield
     Base.metadata.drop_all(bind=test_engine)
@@ -254,6 +257,36 @@ def viewer_user(db_session: Session, test_organization: Organization) -> User:
     return user
 
 
+@pytest.fixture
+def engineer(db_session: Session, test_organization: Organization) -> User:
+    """Create a test engineer."""
+    user = User(
+        email="engineer@example.com",
+        hashed_password=get_password_hash("password123"),
+        first_name="Test",
+        last_name="Engineer",
+        role=UserRole.ENGINEER,
+        organization_id=test_organization.id,
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def engineer_project(db_session: Session, test_organization: Organization, engineer: User) -> Project:
+    """Create a project owned by the engineer."""
+    project = Project(
+        name="Engineer Project",
+        organization_id=test_organization.id,
+        owner_id=engineer.id
+    )
+    db_session.add(project)
+    db_session.commit()
+    return project
+
+
 class TestDataFactory:
     """Factory class for creating test data."""
     
@@ -0,0 +1,257 @@
+"""
+CRUD operation tests for the Vessel Guard application.
+
+Tests for CRUD helpers that write or aggregate in SQL.
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.crud.calculation import calculation_crud
+from app.crud.organization import organization as organization_crud
+from app.crud.project import project as project_crud
+from app.crud.report import report as report_crud
+from app.crud.user import user_crud
+from app.crud.vessel import vessel as vessel_crud
+from app.db.models.calculation import Calculation, CalculationResult, CalculationType, ComplianceStatus
+from app.db.models.organization import Organization
+from app.db.models.project import Project
+from app.db.models.report import Report, ReportFormat, ReportStatus, ReportType
+from app.db.models.user import User
+from app.db.models.vessel import DesignCode, Vessel, VesselGeometry, VesselType
+from app.services.cache_service import cache_service
+
+
+class TestCalculationResultCRUD:
+    """Test appending to CalculationResult JSON lists."""
+    
+    def _create_stored_result(self, db_session: Session, project: Project, user: User) -> CalculationResult:
+        calculation = Calculation(
+            name="Shell thickness",
+            calculation_type=CalculationType.ASME_VIII_DIV_1,
+            input_parameters={"design_pressure": 150.0},
+            project_id=project.id,
+            calculated_by_id=user.id
+        )
+        result = CalculationResult(
+            results={"required_thickness": 0.25},
+            compliance_status=ComplianceStatus.PASS,
+            calculation=calculation
+        )
+        result.add_warning("First")
+        db_session.add(calculation)
+        db_session.commit()
+        return result
+    
+    def test_add_entries_to_stored_result(self, db_session: Session, engineer_project: Project, engineer: User):
+        """Test that entries appended to a stored result are written in place."""
+        result = self._create_stored_result(db_session, engineer_project, engineer)
+        
+        calculation_crud.add_result_warning(db_session, result=result, warning="Second")
+        calculation_crud.add_result_recommendation(
+            db_session, result=result, recommendation="Increase thickness", priority="high"
+        )
+        
+        # The in-memory lists match without a pending flush rewriting them
+        assert [w["text"] for w in result.warnings] == ["First", "Second"]
+        assert result not in db_session.dirty
+        
+        db_session.commit()
+        db_session.expire(result)
+        assert [w["text"] for w in result.warnings] == ["First", "Second"]
+        assert [r["text"] for r in result.recommendations] == ["Increase thickness"]
+        assert result.recommendations[0]["priority"] == "high"
+    
+    def test_add_entry_after_pending_assignment(self, db_session: Session, engineer_project: Project, engineer: User):
+        """Test that appending keeps an assignment that is not flushed yet."""
+        result = self._create_stored_result(db_session, engineer_project, engineer)
+        
+        result.warnings = [{"text": "Replaced"}]
+        calculation_crud.add_result_warning(db_session, result=result, warning="Second")
+        
+        db_session.commit()
+        db_session.expire(result)
+        assert [w["text"] for w in result.warnings] == ["Replaced", "Second"]
+
+
+class TestCRUDOperations:
+    """Test CRUD helpers that write or aggregate in SQL."""
+    
+    def test_update_returning(self, db_session: Session, engineer_project: Project, engineer: User):
+        """Test updating a record with a single UPDATE ... RETURNING."""
+        report = Report(
+            title="Thickness report",
+            report_type=ReportType.CALCULATION,
+            project_id=engineer_project.id,
+            generated_by_id=engineer.id
+        )
+        db_session.add(report)
+        db_session.commit()
+        
+        updated = report_crud.update_returning(
+            db_session, id=report.id, values={"status": ReportStatus.FAILED, "error_message": "boom"}
+        )
+        
+        # The already loaded instance is overwritten with the returned row
+        assert updated is report
+        assert report.status == ReportStatus.FAILED
+        assert report.error_message == "boom"
+        
+        db_session.expire(report)
+        assert report.status == ReportStatus.FAILED
+    
+    def test_update_returning_missing_record(self, db_session: Session):
+        """Test that updating a missing record returns None."""
+        assert report_crud.update_returning(db_session, id=999999, values={"error_message": "x"}) is None
+    
+    def test_get_for_auth_cache_invalidation(self, db_session: Session, engineer: User, monkeypatch):
+        """Test that cached auth data is dropped once a user change commits."""
+        store = {}
+        monkeypatch.setattr(cache_service, "get", lambda key: store.get(key))
+        monkeypatch.setattr(cache_service, "set", lambda key, value, ttl=None: store.__setitem__(key, value))
+        monkeypatch.setattr(cache_service, "delete", lambda key: store.pop(key, None))
+        
+        user = user_crud.get_for_auth(db_session, user_id=engineer.id)
+        assert user.is_active is True
+        assert len(store) == 1
+        
+        # Uncommitted changes leave the cached row in place until commit
+        user_crud.update_last_login(db_session, user=engineer, commit=False)
+        assert len(store) == 1
+        db_session.commit()
+        assert store == {}
+        
+        # Committed writes drop it immediately
+        user_crud.get_for_auth(db_session, user_id=engineer.id)
+        assert len(store) == 1
+        user_crud.update(db_session, db_obj=engineer, obj_in={"is_active": False})
+        assert store == {}
+    
+    def test_auth_cache_invalidated_by_other_writers(self, db_session: Session, test_organization: Organization, engineer: User, monkeypatch):
+        """Test that soft deletes and organization deactivation drop cached auth data."""
+        store = {}
+        monkeypatch.setattr(cache_service, "get", lambda key: store.get(key))
+        monkeypatch.setattr(cache_service, "set", lambda key, value, ttl=None: store.__setitem__(key, value))
+        monkeypatch.setattr(cache_service, "delete", lambda key: store.pop(key, None))
+        
+        user_crud.get_for_auth(db_session, user_id=engineer.id)
+        user_crud.soft_delete(db_session, id=engineer.id)
+        assert store == {}
+        
+        user_crud.update(db_session, db_obj=engineer, obj_in={"is_active": True})
+        user_crud.get_for_auth(db_session, user_id=engineer.id)
+        assert len(store) == 1
+        organization_crud.deactivate(db_session, organization_id=test_organization.id)
+        assert store == {}
+        assert user_crud.get_for_auth(db_session, user_id=engineer.id).is_active is False
+    
+    def test_search_total_on_empty_page(self, db_session: Session, test_organization: Organization, engineer: User):
+        """Test that search counts matches when the requested page is empty."""
+        for index in range(3):
+            db_session.add(Project(
+                name=f"Reactor upgrade {index}",
+                organization_id=test_organization.id,
+                owner_id=engineer.id
+            ))
+        db_session.commit()
+        
+        projects, total = project_crud.search(
+            db_session, query="reactor", organization_id=test_organization.id, limit=2, with_total=True
+        )
+        assert (len(projects), total) == (2, 3)
+        
+        projects, total = project_crud.search(
+            db_session, query="reactor", organization_id=test_organization.id, skip=10, with_total=True
+        )
+        assert (projects, total) == ([], 3)
+        
+        assert project_crud.search(
+            db_session, query="boiler", organization_id=test_organization.id, with_total=True
+        ) == ([], 0)
+    
+    def test_get_vessel_statistics(self, db_session: Session, test_organization: Organization, engineer_project: Project):
+        """Test vessel statistics against the per-statistic queries."""
+        now = datetime.utcnow()
+        specs = [
+            (VesselType.PRESSURE_VESSEL, DesignCode.ASME_VIII_DIV_1, now - timedelta(days=5), None),
+            (VesselType.PRESSURE_VESSEL, DesignCode.API_650, now + timedelta(days=10), None),
+            (VesselType.REACTOR, DesignCode.API_650, now + timedelta(days=100), "toxic gas"),
+            (VesselType.REACTOR, DesignCode.API_650, None, "water"),
+        ]
+        for index, (vessel_type, design_code, next_inspection, fluid) in enumerate(specs):
+            db_session.add(Vessel(
+                tag_number=f"V-{index}",
+                name=f"Vessel {index}",
+                vessel_type=vessel_type,
+                geometry=VesselGeometry.CYLINDRICAL,
+                design_pressure=150.0,
+                design_temperature=350.0,
+                wall_thickness=0.5,
+                material_specification="SA-516 Gr 70",
+                design_code=design_code,
+                project_id=engineer_project.id,
+                next_inspection_date=next_inspection,
+                service_fluid=fluid
+            ))
+        db_session.commit()
+        
+        org_id = test_organization.id
+        statistics = vessel_crud.get_vessel_statistics(db_session, organization_id=org_id)
+        
+        assert statistics["total_vessels"] == vessel_crud.get_vessel_count_by_organization(
+            db_session, organization_id=org_id
+        ) == 4
+        assert statistics["type_breakdown"] == {
+            **{vessel_type.value: 0 for vessel_type in VesselType},
+            "pressure_vessel": 2,
+            "reactor": 2
+        }
+        assert statistics["code_breakdown"] == {
+            **{design_code.value: 0 for design_code in DesignCode},
+            "API_650": 3,
+            "ASME_VIII_DIV_1": 1
+        }
+        assert statistics["overdue_inspections"] == len(list(
+            vessel_crud.get_overdue_for_inspection(db_session, organization_id=org_id)
+        ))
+        assert statistics["due_soon_inspections"] == len(list(
+            vessel_crud.get_due_for_inspection(db_session, organization_id=org_id)
+        ))
+        assert statistics["critical_vessels"] == len(list(
+            vessel_crud.get_critical_vessels(db_session, organization_id=org_id)
+        ))
+    
+    def test_get_report_statistics(self, db_session: Session, test_organization: Organization, engineer_project: Project, engineer: User):
+        """Test report statistics summary values."""
+        specs = [
+            (ReportType.CALCULATION, ReportFormat.PDF, ReportStatus.COMPLETED, 1000),
+            (ReportType.CALCULATION, ReportFormat.PDF, ReportStatus.COMPLETED, 3000),
+            (ReportType.CALCULATION, ReportFormat.HTML, ReportStatus.FAILED, 500),
+            (ReportType.INSPECTION, ReportFormat.DOCX, ReportStatus.COMPLETED, None),
+            (ReportType.INSPECTION, ReportFormat.PDF, ReportStatus.GENERATING, None),
+        ]
+        for index, (report_type, report_format, status, size) in enumerate(specs):
+            db_session.add(Report(
+                title=f"Report {index}",
+                report_type=report_type,
+                report_format=report_format,
+                status=status,
+                file_size_bytes=size,
+                project_id=engineer_project.id,
+                generated_by_id=engineer.id
+            ))
+        db_session.commit()
+        
+        statistics = report_crud.get_report_statistics(db_session, organization_id=test_organization.id)
+        
+        assert statistics == {
+            "total_reports": 5,
+            "completed_reports": 3,
+            "failed_reports": 1,
+            "generating_reports": 1,
+            "reports_by_type": {ReportType.CALCULATION: 3, ReportType.INSPECTION: 2},
+            "reports_by_format": {ReportFormat.PDF: 2, ReportFormat.DOCX: 1},
+            "success_rate": 60.0,
+            "total_file_size_mb": round(4000 / (1024 * 1024), 2)
+        }
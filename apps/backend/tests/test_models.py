@@ -15,7 +15,7 @@ from app.db.models.organization import Organization, SubscriptionType
 from app.db.models.project import Project, ProjectStatus, ProjectPriority
 from app.db.models.vessel import Vessel
 from app.db.models.material import Material, MaterialType, MaterialStandard
-from app.db.models.calculation import Calculation
+from app.db.models.calculation import Calculation, CalculationResult, CalculationType, ComplianceStatus
 from app.db.models.inspection import Inspection, InspectionType, InspectionStatus
 from app.db.models.report import Report
 from app.core.security import get_password_hash
@@ -602,3 +602,50 @@ class TestModelRelationships:
         
         assert test_project.created_by_id is not None
         assert test_project.organization_id is not None
+
+
+class TestCalculationResultModel:
+    """Test CalculationResult JSON list updates."""
+    
+    def _create_result(self, db_session: Session, project: Project, user: User) -> CalculationResult:
+        calculation = Calculation(
+            name="Shell thickness",
+            calculation_type=CalculationType.ASME_VIII_DIV_1,
+            input_parameters={"design_pressure": 150.0},
+            project_id=project.id,
+            calculated_by_id=user.id
+        )
+        result = CalculationResult(
+            results={"required_thickness": 0.25},
+            compliance_status=ComplianceStatus.PASS,
+            calculation=calculation
+        )
+        db_session.add(calculation)
+        return result
+    
+    def test_add_warning_before_insert(self, db_session: Session, engineer_project: Project, engineer: User):
+        """Test that entries added to an unsaved result are inserted with it."""
+        result = self._create_result(db_session, engineer_project, engineer)
+        result.add_warning("Thin wall", severity="high")
+        db_session.commit()
+        
+        db_session.expire(result)
+        assert [w["text"] for w in result.warnings] == ["Thin wall"]
+        assert result.warnings[0]["severity"] == "high"
+    
+    def test_add_entries_to_stored_result(self, db_session: Session, engineer_project: Project, engineer: User):
+        """Test that entries added to a stored result are flushed with it."""
+        result = self._create_result(db_session, engineer_project, engineer)
+        result.add_warning("First")
+        db_session.commit()
+        
+        result.add_warning("Second")
+        result.add_recommendation("Increase thickness", priority="high")
+        assert result in db_session.dirty
+        
+        db_session.commit()
+        db_session.expire(result)
+        assert [w["text"] for w in result.warnings] == ["First", "Second"]
+        assert [r["text"] for r in result.recommendations] == ["Increase thickness"]
+        assert result.recommendations[0]["priority"] == "high"
+        assert "timestamp" in result.recommendations[0]